@@ -24,6 +24,7 @@ model is an OpenAI model, precise BPE counting is used instead.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass
 from typing import Final
@@ -165,6 +166,32 @@ def estimate_tokens(text: str, *, chars_per_token: float = _DEFAULT_CHARS_PER_TO
     return max(1, int(len(text) / chars_per_token + 0.5))
 
 
+# Recent precise counts keyed by (blake2b digest of the text, model).  Only
+# the digest and the count are kept, never the text itself.
+_BPE_CACHE_SIZE: Final[int] = 32
+_bpe_counts: dict[tuple[bytes, str], int] = {}
+
+
+def _bpe_token_count(text: str, model: str) -> int:
+    """Encode *text* with the model's BPE and return the token count.
+
+    The same transcript is counted several times per request (budgeting,
+    fitting, ``/context``), often as a fresh but equal string, so counts
+    are remembered by content digest.  Hashing is far cheaper than BPE
+    encoding.  Failures raise and are therefore never cached.
+    """
+    key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), model)
+    count = _bpe_counts.get(key)
+    if count is None:
+        import tiktoken
+
+        count = len(tiktoken.encoding_for_model(model).encode(text))
+        if len(_bpe_counts) >= _BPE_CACHE_SIZE:
+            _bpe_counts.pop(next(iter(_bpe_counts)), None)
+        _bpe_counts[key] = count
+    return count
+
+
 def estimate_tokens_precise(text: str, model: str = "gpt-4o") -> int | None:
     """Attempt precise token counting via ``tiktoken``.
 
@@ -179,10 +206,7 @@ def estimate_tokens_precise(text: str, model: str = "gpt-4o") -> int | None:
         Exact token count, or None on failure.
     """
     try:
-        import tiktoken
-
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
+        return _bpe_token_count(text, model)
     except Exception:
         return None
 
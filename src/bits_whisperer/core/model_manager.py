@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 from collections.abc import Callable
 from pathlib import Path
@@ -25,6 +26,8 @@ class ModelManager:
     def __init__(self, models_dir: Path = MODELS_DIR) -> None:
         self._models_dir = models_dir
         self._models_dir.mkdir(parents=True, exist_ok=True)
+        # Ids of models on disk; None until scanned, reset on download/delete
+        self._downloaded_ids: frozenset[str] | None = None
 
     @property
     def models_dir(self) -> Path:
@@ -70,6 +73,28 @@ class ModelManager:
         # Direct structure fallback (manual placement)
         return any(model_dir.glob("*.bin")) or any(model_dir.glob("config.json"))
 
+    def downloaded_ids(self) -> frozenset[str]:
+        """Return the ids of models that are downloaded locally.
+
+        The models directory is listed once and the result cached until a
+        model is downloaded or deleted through this manager.
+
+        Returns:
+            Frozen set of model identifiers present on disk.
+        """
+        if self._downloaded_ids is None:
+            try:
+                with os.scandir(self._models_dir) as it:
+                    present = {entry.name for entry in it if entry.is_dir()}
+            except FileNotFoundError:
+                present = set()
+            self._downloaded_ids = frozenset(
+                m.id
+                for m in WHISPER_MODELS
+                if self._model_dir(m.id).name in present and self.is_downloaded(m.id)
+            )
+        return self._downloaded_ids
+
     def get_model_path(self, model_id: str) -> Path | None:
         """Return the local path for a downloaded model.
 
@@ -161,20 +186,18 @@ class ModelManager:
             progress_callback(model_id, 0.0)
 
         try:
-            # faster-whisper downloads and converts the model automatically
-            # when you instantiate WhisperModel with the model size.
-            # We trigger this by importing and creating a model instance.
-            from faster_whisper import WhisperModel
+            # Fetch the snapshot into the HuggingFace cache layout without
+            # loading the weights into memory.  huggingface_hub keeps one
+            # pooled HTTP session per thread, so files of a model share
+            # connections.
+            from faster_whisper import download_model as fw_download_model
 
-            # This downloads the model if not cached
-            _model = WhisperModel(
+            fw_download_model(
                 model_info.repo_id or model_id,
-                device="cpu",
-                compute_type="int8",
-                download_root=str(self._models_dir),
+                cache_dir=str(self._models_dir),
             )
-            del _model  # Release memory — we just wanted the download
 
+            self._downloaded_ids = None
             if progress_callback:
                 progress_callback(model_id, 100.0)
 
@@ -208,6 +231,7 @@ class ModelManager:
         model_dir = self._model_dir(model_id)
         if model_dir.exists():
             shutil.rmtree(model_dir, ignore_errors=True)
+            self._downloaded_ids = None
             logger.info("Deleted model '%s'.", model_id)
             return True
         return False
@@ -10,8 +10,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from dataclasses import asdict, dataclass, field
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from bits_whisperer.utils.constants import (
     DATA_DIR,
@@ -26,10 +27,57 @@ from bits_whisperer.utils.constants import (
     TRANSCRIPTS_DIR,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
 _SETTINGS_PATH = DATA_DIR / "settings.json"
 
+# Last instance returned by AppSettings.cached(), with the file stamp it was read at
+_cached: tuple[tuple[str, int, int] | None, AppSettings] | None = None
+
+
+def _file_stamp(path: Path) -> tuple[str, int, int] | None:
+    """Return ``(path, mtime_ns, size)`` for *path*, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def _invalidate_cached() -> None:
+    """Forget the instance handed out by :meth:`AppSettings.cached`."""
+    global _cached
+    _cached = None
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    """Return the contents of *path*, or None if it cannot be read."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash.
+
+    Windows cannot open directories this way, and NTFS journals renames
+    itself, so this is a no-op there.
+
+    Args:
+        directory: Directory containing the renamed file.
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 # -----------------------------------------------------------------------
 # Nested option groups
@@ -397,16 +445,32 @@ class AppSettings:
     # ------------------------------------------------------------------ #
 
     def save(self) -> None:
-        """Persist settings to disk as JSON."""
+        """Persist settings to disk as JSON.
+
+        The file is written to a temporary sibling, flushed with a single
+        fsync and then renamed over the old one, so a crash mid-save never
+        leaves a truncated settings file behind.  If the file already holds
+        exactly these settings, nothing is written.
+        """
+        tmp_path = _SETTINGS_PATH.with_name(_SETTINGS_PATH.name + ".tmp")
         try:
-            data = asdict(self)
-            _SETTINGS_PATH.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            data = json.dumps(asdict(self), indent=2, ensure_ascii=False).encode("utf-8")
+            if _read_bytes(_SETTINGS_PATH) == data:
+                logger.debug("Settings unchanged; skipping write")
+                return
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, _SETTINGS_PATH)
+            _fsync_dir(_SETTINGS_PATH.parent)
+            _invalidate_cached()
             logger.info("Settings saved to %s", _SETTINGS_PATH)
         except Exception as exc:
             logger.error("Failed to save settings: %s", exc)
+            tmp_path.unlink(missing_ok=True)
 
     @classmethod
     def load(cls) -> AppSettings:
@@ -424,6 +488,22 @@ class AppSettings:
             logger.warning("Failed to load settings, using defaults: %s", exc)
             return cls()
 
+    @classmethod
+    def cached(cls) -> AppSettings:
+        """Return settings for read-only use, re-reading the file only when it changes.
+
+        The instance is shared between callers, so modify a copy from
+        :meth:`load` instead of the returned object.
+
+        Returns:
+            Populated AppSettings instance.
+        """
+        global _cached
+        stamp = _file_stamp(_SETTINGS_PATH)
+        if _cached is None or _cached[0] != stamp:
+            _cached = (stamp, cls.load())
+        return _cached[1]
+
     @classmethod
     def _from_dict(cls, data: dict[str, Any]) -> AppSettings:
         """Reconstruct from a JSON-compatible dict.
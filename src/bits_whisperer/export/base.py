@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -57,6 +58,18 @@ class ExportFormatter(ABC):
         ...
 
 
+def _split_timestamp(seconds: float) -> tuple[int, int, int, int]:
+    """Split *seconds* into whole hours, minutes, seconds and milliseconds.
+
+    The clock fields come from one integer ``divmod`` chain on the whole
+    seconds; milliseconds are truncated, not rounded.
+    """
+    whole = math.floor(seconds)
+    minutes, secs = divmod(whole, 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, secs, int((seconds - whole) * 1000)
+
+
 def format_timestamp(seconds: float) -> str:
     """Convert seconds to HH:MM:SS.mmm format.
 
@@ -66,10 +79,7 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string.
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    ms = int((seconds % 1) * 1000)
+    hours, minutes, secs, ms = _split_timestamp(seconds)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
 
 
@@ -82,4 +92,5 @@ def format_timestamp_srt(seconds: float) -> str:
     Returns:
         SRT-formatted timestamp.
     """
-    return format_timestamp(seconds).replace(".", ",")
+    hours, minutes, secs, ms = _split_timestamp(seconds)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
@@ -60,8 +60,8 @@ class JSONFormatter(ExportFormatter):
             for seg in data.get("segments", []):
                 seg.pop("confidence", None)
 
-        output_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # json.dump encodes incrementally, so the document is never held
+        # as one string alongside the dict
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
         return output_path
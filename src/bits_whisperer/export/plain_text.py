@@ -44,21 +44,25 @@ class PlainTextFormatter(ExportFormatter):
             Path to the written file.
         """
         output_path = Path(output_path)
-        lines: list[str] = []
 
-        if result.segments:
-            for seg in result.segments:
-                parts: list[str] = []
-                if include_timestamps:
-                    parts.append(f"[{format_timestamp(seg.start)}]")
-                if include_speakers and seg.speaker:
-                    parts.append(f"{seg.speaker}:")
-                parts.append(seg.text)
-                if include_confidence and seg.confidence > 0:
-                    parts.append(f"({seg.confidence:.0%})")
-                lines.append(" ".join(parts))
-        else:
-            lines.append(result.full_text)
+        # Paragraphs are written one at a time so long transcripts are
+        # never assembled into a single string
+        with output_path.open("w", encoding="utf-8") as f:
+            if result.segments:
+                sep = ""
+                for seg in result.segments:
+                    parts: list[str] = []
+                    if include_timestamps:
+                        parts.append(f"[{format_timestamp(seg.start)}]")
+                    if include_speakers and seg.speaker:
+                        parts.append(f"{seg.speaker}:")
+                    parts.append(seg.text)
+                    if include_confidence and seg.confidence > 0:
+                        parts.append(f"({seg.confidence:.0%})")
+                    f.write(sep)
+                    f.write(" ".join(parts))
+                    sep = "\n\n"
+            else:
+                f.write(result.full_text)
 
-        output_path.write_text("\n\n".join(lines), encoding="utf-8")
         return output_path
@@ -44,27 +44,28 @@ class SRTFormatter(ExportFormatter):
             Path to the written file.
         """
         output_path = Path(output_path)
-        lines: list[str] = []
 
-        if result.segments:
-            for idx, seg in enumerate(result.segments, start=1):
-                lines.append(str(idx))
-                lines.append(
-                    f"{format_timestamp_srt(seg.start)} --> {format_timestamp_srt(seg.end)}"
+        # Cues are written one at a time so long transcripts are never
+        # assembled into a single string
+        with output_path.open("w", encoding="utf-8") as f:
+            if result.segments:
+                for idx, seg in enumerate(result.segments, start=1):
+                    text = seg.text
+                    if include_speakers and seg.speaker:
+                        text = f"[{seg.speaker}] {text}"
+                    if idx > 1:
+                        f.write("\n")  # blank line between cues
+                    f.write(
+                        f"{idx}\n"
+                        f"{format_timestamp_srt(seg.start)} --> {format_timestamp_srt(seg.end)}\n"
+                        f"{text}\n"
+                    )
+            else:
+                # Fallback: single cue spanning full duration
+                f.write(
+                    f"1\n{format_timestamp_srt(0)} --> "
+                    f"{format_timestamp_srt(result.duration_seconds)}\n"
+                    f"{result.full_text}\n"
                 )
-                text = seg.text
-                if include_speakers and seg.speaker:
-                    text = f"[{seg.speaker}] {text}"
-                lines.append(text)
-                lines.append("")  # blank line between cues
-        else:
-            # Fallback: single cue spanning full duration
-            lines.append("1")
-            lines.append(
-                f"{format_timestamp_srt(0)} --> " f"{format_timestamp_srt(result.duration_seconds)}"
-            )
-            lines.append(result.full_text)
-            lines.append("")
 
-        output_path.write_text("\n".join(lines), encoding="utf-8")
         return output_path
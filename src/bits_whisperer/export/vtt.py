@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from bits_whisperer.core.job import TranscriptionResult
-from bits_whisperer.export.base import ExportFormatter
+from bits_whisperer.export.base import ExportFormatter, format_timestamp
 
 
 class VTTFormatter(ExportFormatter):
@@ -44,31 +44,25 @@ class VTTFormatter(ExportFormatter):
             Path to the written file.
         """
         output_path = Path(output_path)
-        lines: list[str] = ["WEBVTT", ""]
 
-        if result.segments:
-            for idx, seg in enumerate(result.segments, start=1):
-                lines.append(str(idx))
-                lines.append(f"{_vtt_ts(seg.start)} --> {_vtt_ts(seg.end)}")
-                text = seg.text
-                if include_speakers and seg.speaker:
-                    text = f"<v {seg.speaker}>{text}"
-                lines.append(text)
-                lines.append("")
-        else:
-            lines.append("1")
-            lines.append(f"{_vtt_ts(0)} --> {_vtt_ts(result.duration_seconds)}")
-            lines.append(result.full_text)
-            lines.append("")
+        # Cues are written one at a time so long transcripts are never
+        # assembled into a single string
+        with output_path.open("w", encoding="utf-8") as f:
+            f.write("WEBVTT\n")
+            if result.segments:
+                for idx, seg in enumerate(result.segments, start=1):
+                    text = seg.text
+                    if include_speakers and seg.speaker:
+                        text = f"<v {seg.speaker}>{text}"
+                    f.write(
+                        f"\n{idx}\n"
+                        f"{format_timestamp(seg.start)} --> {format_timestamp(seg.end)}\n"
+                        f"{text}\n"
+                    )
+            else:
+                f.write(
+                    f"\n1\n{format_timestamp(0)} --> {format_timestamp(result.duration_seconds)}\n"
+                    f"{result.full_text}\n"
+                )
 
-        output_path.write_text("\n".join(lines), encoding="utf-8")
         return output_path
-
-
-def _vtt_ts(seconds: float) -> str:
-    """Format seconds as VTT timestamp HH:MM:SS.mmm."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    ms = int((seconds % 1) * 1000)
-    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,21 @@ class KeyStore:
         keyring.set_password(_SERVICE_NAME, _key_id(provider), key)
         logger.debug("Stored key for provider %s", provider)
 
+    def store_keys_batch(self, keys: dict[str, str]) -> None:
+        """Store several API keys with one backend lookup.
+
+        Args:
+            keys: Mapping of provider identifier to secret value.
+        """
+        if not self._available or not keys:
+            return
+        import keyring
+
+        backend = keyring.get_keyring()
+        for provider, key in keys.items():
+            backend.set_password(_SERVICE_NAME, _key_id(provider), key)
+        logger.debug("Stored keys for providers %s", ", ".join(keys))
+
     def get_key(self, provider: str) -> str | None:
         """Retrieve a stored API key. Returns ``None`` if not found.
 
@@ -87,6 +103,25 @@ class KeyStore:
 
         return keyring.get_password(_SERVICE_NAME, _key_id(provider))
 
+    def get_keys(self, providers: Iterable[str]) -> dict[str, str | None]:
+        """Retrieve several stored API keys with one backend lookup.
+
+        The keyring backend is resolved once and reused for every provider,
+        instead of once per :meth:`get_key` call.
+
+        Args:
+            providers: Provider identifiers.
+
+        Returns:
+            Mapping of each provider to its key, or ``None`` if not found.
+        """
+        if not self._available:
+            return dict.fromkeys(providers)
+        import keyring
+
+        backend = keyring.get_keyring()
+        return {p: backend.get_password(_SERVICE_NAME, _key_id(p)) for p in providers}
+
     def delete_key(self, provider: str) -> bool:
         """Delete an API key. Returns ``True`` if the key was found and deleted.
 
@@ -114,7 +149,7 @@ class KeyStore:
 
     def list_providers_with_keys(self) -> list[str]:
         """Return provider identifiers that have stored keys."""
-        return [p for p in _KEY_NAMES if self.has_key(p)]
+        return [p for p, key in self.get_keys(_KEY_NAMES).items() if key is not None]
 
     @staticmethod
     def get_supported_providers() -> dict[str, str]:
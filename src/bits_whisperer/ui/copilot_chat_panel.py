@@ -32,6 +32,7 @@ import wx
 
 from bits_whisperer.core.settings import AppSettings
 from bits_whisperer.ui.slash_commands import (
+    SlashCommand,
     SlashCommandRegistry,
     build_default_registry,
     parse_slash_command,
@@ -90,6 +91,15 @@ class CopilotChatPanel(wx.Panel):
 
         # Conversation state — shared across all providers
         self._conversation_history: list[dict[str, str]] = []
+        self._last_assistant_idx = -1  # index of the newest assistant message, for /copy
+        # Token count per history message for /context, and the (model, provider)
+        # they were counted for
+        self._history_token_cache: tuple[tuple[str, str], list[tuple[dict[str, str], int]]] = (
+            ("", ""),
+            [],
+        )
+        # (settings, key store, AIService, context manager) reused by slash commands
+        self._slash_services: tuple | None = None
         self._transcript_context: str = ""
         self._available_providers: list[dict[str, str]] = []
 
@@ -665,7 +675,7 @@ class CopilotChatPanel(wx.Panel):
                 len(msg.content),
                 msg.model,
             )
-            self._conversation_history.append({"role": "assistant", "content": msg.content})
+            self._append_assistant_history(msg.content)
 
             def _done() -> None:
                 self._append_text("\n\n")
@@ -724,7 +734,7 @@ class CopilotChatPanel(wx.Panel):
             safe_call_after(self._append_streaming_text, delta)
 
         def on_complete(response) -> None:
-            self._conversation_history.append({"role": "assistant", "content": response.text})
+            self._append_assistant_history(response.text)
 
             def _done() -> None:
                 self._append_text("\n\n")
@@ -808,9 +818,19 @@ class CopilotChatPanel(wx.Panel):
     # Clear / Reset                                                        #
     # ------------------------------------------------------------------ #
 
+    def _append_assistant_history(self, content: str) -> None:
+        """Record an AI reply in the conversation history.
+
+        Args:
+            content: Full text of the reply.
+        """
+        self._conversation_history.append({"role": "assistant", "content": content})
+        self._last_assistant_idx = len(self._conversation_history) - 1
+
     def _on_clear(self, _event: wx.CommandEvent) -> None:
         """Clear the conversation history and reset the chat."""
         self._conversation_history.clear()
+        self._last_assistant_idx = -1
         if self._copilot_service:
             self._copilot_service.clear_conversation()
         self._chat_display.SetValue("")
@@ -844,6 +864,7 @@ class _SlashAutocompletePopup(wx.PopupTransientWindow):
         self._panel = panel
         self._anchor = anchor
         self._commands: list = []
+        self._labels: dict[SlashCommand, str] = {}  # display label per command
 
         self._listbox = wx.ListBox(self, style=wx.LB_SINGLE | wx.LB_NEEDED_SB)
         set_accessible_name(self._listbox, "Slash command suggestions")
@@ -859,12 +880,20 @@ class _SlashAutocompletePopup(wx.PopupTransientWindow):
         Args:
             commands: List of SlashCommand objects to display.
         """
-        self._commands = commands
-        self._listbox.Clear()
-        for cmd in commands:
-            hint = f"  {cmd.arg_hint}" if cmd.arg_hint else ""
-            label = f"/{cmd.name}{hint} — {cmd.description}"
-            self._listbox.Append(label)
+        # The items only need replacing when the suggestions changed since
+        # the last keystroke; selection and size are always reset below
+        if commands != self._commands:
+            self._commands = commands
+            labels = self._labels
+            items: list[str] = []
+            for cmd in commands:
+                label = labels.get(cmd)
+                if label is None:
+                    hint = f"  {cmd.arg_hint}" if cmd.arg_hint else ""
+                    label = labels[cmd] = f"/{cmd.name}{hint} — {cmd.description}"
+                items.append(label)
+            # One Set() call replaces the items with a single repaint
+            self._listbox.Set(items)
 
         if self._listbox.GetCount() > 0:
             self._listbox.SetSelection(0)
@@ -15,9 +15,13 @@ from the very first launch.
 
 from __future__ import annotations
 
+import functools
 import logging
 import threading
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
 
 import wx
 import wx.adv
@@ -40,18 +44,141 @@ from bits_whisperer.utils.constants import (
     MODELS_DIR,
     WHISPER_MODELS,
 )
-from bits_whisperer.utils.platform_utils import (
-    get_free_disk_space_mb,
-    has_sufficient_disk_space,
-)
+from bits_whisperer.utils.platform_utils import get_free_disk_space_mb
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from pathlib import Path
+
     from bits_whisperer.core.device_probe import DeviceProfile
 
 logger = logging.getLogger(__name__)
 
 _WIZARD_DONE_FILE = DATA_DIR / ".wizard_complete"
 
+# Cloud providers offered on the providers page, as
+# key id, display name, help URL and short description
+_PROVIDER_METADATA: Final[tuple[tuple[str, str, str, str], ...]] = (
+    (
+        "openai",
+        "OpenAI (Whisper API)",
+        "https://platform.openai.com/api-keys",
+        "Fast and reliable. $0.006/min.",
+    ),
+    (
+        "groq",
+        "Groq (LPU Whisper)",
+        "https://console.groq.com/keys",
+        "188x real-time speed. $0.003/min.",
+    ),
+    (
+        "gemini",
+        "Google Gemini",
+        "https://makersuite.google.com/app/apikey",
+        "Cheapest cloud option. $0.0002/min.",
+    ),
+    (
+        "deepgram",
+        "Deepgram (Nova-2)",
+        "https://console.deepgram.com/",
+        "Smart formatting. $0.013/min.",
+    ),
+    (
+        "assemblyai",
+        "AssemblyAI",
+        "https://www.assemblyai.com/app/account",
+        "Speaker labels, auto-chapters. $0.011/min.",
+    ),
+    (
+        "elevenlabs",
+        "ElevenLabs (Scribe)",
+        "https://elevenlabs.io/app/settings/api-keys",
+        "99+ languages. $0.005/min.",
+    ),
+    (
+        "auphonic",
+        "Auphonic",
+        "https://auphonic.com/accounts/settings/#api-key",
+        "Audio post-production + Whisper. 2 free hours/month.",
+    ),
+)
+
+# Providers whose API keys the wizard reads and reports on
+_PROVIDER_KEY_IDS: tuple[str, ...] = tuple(p[0] for p in _PROVIDER_METADATA)
+
+# Key ids entered on the AI page, and the wizard attribute holding each field
+_AI_KEY_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    ("gemini", "_wizard_gemini_key"),
+    ("openai", "_wizard_openai_key"),
+)
+
+# Pricing reference shown on the budget page
+_PRICING_TEXT: Final[str] = "\n".join(
+    (
+        "Gemini:            ~$0.0002/min  (cheapest)",
+        "Groq Whisper:      ~$0.003/min",
+        "ElevenLabs Scribe: ~$0.005/min",
+        "OpenAI Whisper:    ~$0.006/min",
+        "AssemblyAI:        ~$0.011/min",
+        "Deepgram Nova-2:   ~$0.013/min",
+        "Azure Speech:      ~$0.017/min",
+        "Auphonic:          2 free hours/month, then paid",
+        "Local models:      Always free",
+    )
+)
+
+# Choices offered on the preferences page
+_LANGUAGE_CHOICES: Final[tuple[str, ...]] = (
+    "Auto-detect",
+    "English",
+    "Spanish",
+    "French",
+    "German",
+    "Italian",
+    "Portuguese",
+    "Dutch",
+    "Russian",
+    "Chinese",
+    "Japanese",
+    "Korean",
+    "Arabic",
+    "Hindi",
+)
+_FORMAT_CHOICES: Final[tuple[str, ...]] = (
+    "Plain Text (.txt)",
+    "Markdown (.md)",
+    "Word (.docx)",
+    "SRT Subtitles (.srt)",
+)
+# Setting values for the choices above, in the same order
+_LANG_CODES: Final[tuple[str, ...]] = (
+    "auto",
+    "en",
+    "es",
+    "fr",
+    "de",
+    "it",
+    "pt",
+    "nl",
+    "ru",
+    "zh",
+    "ja",
+    "ko",
+    "ar",
+    "hi",
+)
+_FMT_CODES: Final[tuple[str, ...]] = ("txt", "md", "docx", "srt")
+
+# Position of each model in WHISPER_MODELS, which runs from smallest to largest
+_MODEL_RANK: Final[dict[str, int]] = {m.id: i for i, m in enumerate(WHISPER_MODELS)}
+
+# Upper bound on concurrent model downloads
+_MAX_PARALLEL_DOWNLOADS = 4
+
+# Seconds a free-disk-space reading is reused before the volume is queried again
+_FREE_SPACE_TTL_S = 2.0
+
 # Page indices
 PAGE_WELCOME = 0
 PAGE_MODE = 1
@@ -64,6 +191,167 @@ PAGE_PREFERENCES = 7
 PAGE_SUMMARY = 8
 _TOTAL_PAGES = 9
 
+# (header, subtitle) shown above each page, indexed by page index
+_PAGE_HEADINGS: tuple[tuple[str, str], ...] = (
+    (
+        f"Welcome to {APP_NAME}!",
+        "Let's get you set up in just a few steps. This will only take a minute.",
+    ),
+    (
+        "Choose Your Experience",
+        "Pick the interface style that suits you best. "
+        "You can switch at any time from the View menu.",
+    ),
+    (
+        "Your Computer",
+        "We've scanned your hardware to find the best AI models for you.",
+    ),
+    (
+        "Choose Your AI Models",
+        "Select which models to download for offline transcription. "
+        "You can always download more later.",
+    ),
+    (
+        "Cloud Services (Optional)",
+        "Connect cloud transcription services for maximum accuracy. "
+        "You can skip this and use free local models.",
+    ),
+    (
+        "AI Features (Optional)",
+        "Enhance your transcripts with AI-powered summarization, "
+        "translation, and interactive Q&A.",
+    ),
+    (
+        "Spending Limits",
+        "Control how much you spend on paid cloud transcription services.",
+    ),
+    (
+        "Your Preferences",
+        "Customize how BITS Whisperer works for you.",
+    ),
+    (
+        "You're All Set!",
+        f"Here's a summary of your setup. Click Finish to start using {APP_NAME}.",
+    ),
+)
+# Accessible name for each page panel, indexed by page index
+_PAGE_NAMES: tuple[str, ...] = (
+    "Welcome page",
+    "Experience mode page",
+    "Hardware detection page",
+    "Model selection page",
+    "Cloud services setup page",
+    "AI and Copilot setup page",
+    "Spending limits page",
+    "Preferences page",
+    "Setup summary page",
+)
+
+# Static page copy, built once at import time
+_WELCOME_INTRO = (
+    f"{APP_NAME} turns your audio files into text using the latest AI technology. "
+    "You can use free on-device models that keep your data private, or connect "
+    "to cloud services for maximum accuracy.\n\n"
+    "This setup wizard will:\n"
+    "  1.  Let you choose Basic or Advanced mode\n"
+    "  2.  Detect your computer's hardware\n"
+    "  3.  Recommend AI models that work best on your machine\n"
+    "  4.  Let you download models for offline use\n"
+    "  5.  Help you connect cloud services (optional)\n"
+    "  6.  Set up AI features and spending limits\n"
+    "  7.  Set your preferences\n\n"
+    "You can always change these settings later from the Tools menu."
+)
+
+_WELCOME_HIGHLIGHTS = "\n".join(
+    f"  \u2022  {h}"
+    for h in (
+        "16 transcription engines — cloud and local",
+        "14 AI models matched to your hardware",
+        "7 export formats (Text, Word, SRT, and more)",
+        "Full keyboard navigation and screen reader support",
+        "Your audio stays on your computer with local models",
+    )
+)
+
+_MODE_INTRO = (
+    f"{APP_NAME} offers two experience modes to match your comfort level. "
+    "Choose Basic for a streamlined experience, or Advanced for full control."
+)
+
+_MODE_BASIC_FEATURES = (
+    "What you get in Basic mode:\n"
+    "  \u2022  Simple settings: General, Output, and Provider tabs\n"
+    "  \u2022  Only activated cloud providers appear for use\n"
+    "  \u2022  Guided provider setup via Add Provider wizard\n"
+    "  \u2022  Recommended defaults applied automatically\n"
+    "  \u2022  Clean, focused interface with fewer options\n\n"
+    "Best for: First-time users, accessibility-focused workflows, "
+    "and anyone who prefers simplicity."
+)
+
+_MODE_ADV_FEATURES = (
+    "What you get in Advanced mode (everything in Basic, plus):\n"
+    "  \u2022  All 7 settings tabs including Audio Processing and Advanced\n"
+    "  \u2022  All cloud providers visible regardless of activation\n"
+    "  \u2022  Audio preprocessing chain (noise gate, EQ, compressor)\n"
+    "  \u2022  Concurrency, chunking, and GPU configuration\n"
+    "  \u2022  CPU thread and compute type controls\n"
+    "  \u2022  Log level and debug settings\n\n"
+    "Best for: Power users, audio professionals, and developers."
+)
+
+_MODE_TIP = (
+    "Tip: You can switch between Basic and Advanced mode at any time "
+    "using View > Advanced Mode (Ctrl+Shift+A) in the menu bar."
+)
+
+
+def _make_link(parent: wx.Window, url: str, name: str) -> wx.adv.HyperlinkCtrl:
+    """Create a "Get key" link to a provider's API key page.
+
+    A real hyperlink control is kept (rather than a clickable label) so the
+    link stays reachable with Tab and is announced by screen readers.
+
+    Args:
+        parent: Parent window.
+        url: Page opened in the default browser.
+        name: Accessible name for screen readers.
+
+    Returns:
+        The hyperlink control.
+    """
+    link = wx.adv.HyperlinkCtrl(parent, label="Get key", url=url)
+    set_accessible_name(link, name)
+    return link
+
+
+def _row(*items: tuple) -> wx.BoxSizer:
+    """Lay out controls side by side with a single ``AddMany`` call.
+
+    Args:
+        *items: ``(window, proportion, flag[, border])`` tuples, left to right.
+
+    Returns:
+        A horizontal box sizer holding the items.
+    """
+    row = wx.BoxSizer(wx.HORIZONTAL)
+    row.AddMany(items)
+    return row
+
+
+def _code_at(codes: tuple[str, ...], sel: int) -> str:
+    """Map a choice selection to its setting value.
+
+    Args:
+        codes: Setting values in choice order; the first is the default.
+        sel: Index from ``GetSelection()``, ``wx.NOT_FOUND`` when nothing is selected.
+
+    Returns:
+        The value at *sel*, or the first value when *sel* is out of range.
+    """
+    return codes[sel] if 0 <= sel < len(codes) else codes[0]
+
 
 def needs_wizard() -> bool:
     """Check whether the first-run wizard should be shown.
@@ -75,7 +363,13 @@ def needs_wizard() -> bool:
 
 
 def mark_wizard_complete() -> None:
-    """Mark the wizard as completed so it won't show again."""
+    """Mark the wizard as completed so it won't show again.
+
+    Re-running the wizard from the Tools menu finds the marker already
+    present, so it is only written the first time.
+    """
+    if _WIZARD_DONE_FILE.exists():
+        return
     try:
         _WIZARD_DONE_FILE.parent.mkdir(parents=True, exist_ok=True)
         _WIZARD_DONE_FILE.write_text("done", encoding="utf-8")
@@ -83,6 +377,75 @@ def mark_wizard_complete() -> None:
         logger.debug("Could not write wizard completion marker")
 
 
+@dataclass(slots=True)
+class _ModelRow:
+    """Widgets and download status of one model on the models page."""
+
+    checkbox: wx.CheckBox
+    status_label: wx.StaticText
+    status: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class _SaveSpec:
+    """Copy one wizard control's value into a settings field.
+
+    Attributes:
+        attr: Wizard attribute holding the control.
+        section: Settings section, e.g. ``"general"``.
+        field: Field within the section.
+        transform: Optional conversion applied to the value read.
+        getter: Control method that reads the value.
+    """
+
+    attr: str
+    section: str
+    field: str
+    transform: Callable[[Any], Any] | None = None
+    getter: str = "GetValue"
+
+
+# Controls saved when leaving each page, keyed by page index.  API keys are
+# staged separately in _save_current_page_state.
+_PAGE_SAVERS: Final[dict[int, tuple[_SaveSpec, ...]]] = {
+    PAGE_MODE: (
+        _SaveSpec(
+            "_mode_advanced",
+            "general",
+            "experience_mode",
+            lambda adv: "advanced" if adv else "basic",
+        ),
+    ),
+    PAGE_AI_COPILOT: (_SaveSpec("_wizard_copilot_enable", "copilot", "enabled"),),
+    PAGE_BUDGET: (
+        _SaveSpec("_wiz_budget_enabled", "budget", "enabled"),
+        _SaveSpec("_wiz_always_confirm", "budget", "always_confirm_paid"),
+        _SaveSpec("_wiz_budget_limit", "budget", "default_limit_usd"),
+    ),
+    PAGE_PREFERENCES: (
+        _SaveSpec(
+            "_pref_language",
+            "general",
+            "language",
+            lambda sel: _code_at(_LANG_CODES, sel),
+            "GetSelection",
+        ),
+        _SaveSpec(
+            "_pref_format",
+            "output",
+            "default_format",
+            lambda sel: _code_at(_FMT_CODES, sel),
+            "GetSelection",
+        ),
+        _SaveSpec("_pref_auto_export", "general", "auto_export"),
+        _SaveSpec("_pref_timestamps", "transcription", "include_timestamps"),
+        _SaveSpec("_pref_minimize", "general", "minimize_to_tray"),
+        _SaveSpec("_pref_notifications", "general", "show_notifications"),
+        _SaveSpec("_pref_updates", "general", "check_updates_on_start"),
+    ),
+}
+
+
 class SetupWizard(wx.Dialog):
     """Multi-page first-run setup wizard.
 
@@ -107,19 +470,103 @@ class SetupWizard(wx.Dialog):
         self._device_profile: DeviceProfile | None = None
         self._model_manager = ModelManager()
         self._key_store = KeyStore()
-        self._settings = AppSettings()
+        # Start from the saved file so a re-run from the Help menu compares
+        # against the user's current choices, not the defaults
+        self._settings = AppSettings.load()
+        self._dirty = False  # a setting differs from the settings file
 
         # --- State ---
         self._current_page = PAGE_WELCOME
         self._selected_models: list[str] = []
-        self._download_threads: dict[str, threading.Thread] = {}
-        self._download_status: dict[str, str] = {}  # model_id -> status text
+        # Bounded pool so several large models don't saturate network and
+        # disk; workers are only spawned as downloads are queued
+        self._dl_executor = ThreadPoolExecutor(
+            max_workers=_MAX_PARALLEL_DOWNLOADS, thread_name_prefix="wizard-dl"
+        )
+        self._dl_futures: dict[str, Future[Path]] = {}  # in-flight downloads only
+        # Per-model percentages written by workers and finished-model status
+        # labels; both are drawn in one batch by a 10 Hz timer
+        self._dl_progress: dict[str, float] = {}
+        self._dl_sizes_mb: dict[str, int] = {}
+        self._pending_status: dict[str, str] = {}
+        self._gauge_timer = wx.Timer(self)
+        self._model_rows: dict[str, _ModelRow] = {}  # filled by the models page
         self._provider_keys: dict[str, str] = {}
+        # Keyring lookups can block on the OS credential store; remember
+        # them for the wizard session ("" means no key stored)
+        self._key_cache: dict[str, str] = {}
+        self._info_metrics: tuple[int, int] | None = None
+        self._fw_available: bool | None = None  # None until the preload finishes
+        self._copilot_sdk_ok: bool | None = None  # None until the preload finishes
+        self._recommended_model: str | None = None
+        self._completion_shown = False  # download summary shown for this batch
+        # Free disk space in MB and the monotonic time it was measured
+        self._free_mb_val: float = 0.0
+        self._free_mb_ts: float = 0.0
+        self._size_label: wx.TextCtrl | None = None  # created with the models page
+
+        # Controls saved by _save_current_page_state.  They stay None until
+        # their page is first built, so unvisited pages are simply skipped.
+        self._mode_advanced: wx.RadioButton | None = None
+        self._provider_inputs: dict[str, wx.TextCtrl] = {}  # expanded panes only
+        self._wizard_gemini_key: wx.TextCtrl | None = None
+        self._wizard_openai_key: wx.TextCtrl | None = None
+        self._wizard_copilot_enable: wx.CheckBox | None = None
+        self._wiz_budget_enabled: wx.CheckBox | None = None
+        self._wiz_always_confirm: wx.CheckBox | None = None
+        self._wiz_budget_limit: wx.SpinCtrlDouble | None = None
+        self._pref_language: wx.Choice | None = None
+        self._pref_format: wx.Choice | None = None
+        self._pref_auto_export: wx.CheckBox | None = None
+        self._pref_timestamps: wx.CheckBox | None = None
+        self._pref_minimize: wx.CheckBox | None = None
+        self._pref_notifications: wx.CheckBox | None = None
+        self._pref_updates: wx.CheckBox | None = None
+
+        # Page builders, indexed by page index.  Each page's controls are
+        # created by _show_page on first visit, so opening the dialog only
+        # builds the welcome page and unvisited pages hold no widgets.
+        self._builders = (
+            self._build_welcome_page,
+            self._build_mode_page,
+            self._build_hardware_page,
+            self._build_models_page,
+            self._build_providers_page,
+            self._build_ai_copilot_page,
+            self._build_budget_page,
+            self._build_preferences_page,
+            self._build_summary_page,
+        )
+        # Extra save steps for pages whose state is not a plain _PAGE_SAVERS copy
+        self._page_savers: dict[int, Callable[[], None]] = {
+            PAGE_PROVIDERS: self._save_provider_keys,
+            PAGE_AI_COPILOT: self._save_ai_keys,
+        }
 
         # --- Build UI ---
         self._build_ui()
         self._show_page(PAGE_WELCOME)
 
+        # Load faster-whisper off the UI thread so the download button
+        # doesn't stall while the native library initialises.
+        threading.Thread(
+            target=self._preload_faster_whisper,
+            daemon=True,
+            name="wizard-fw-preload",
+        ).start()
+        # Likewise probe the Copilot SDK before the AI page is reached
+        threading.Thread(
+            target=self._preload_copilot_sdk,
+            daemon=True,
+            name="wizard-sdk-preload",
+        ).start()
+        # Warm the key cache so later pages don't wait on the OS keyring
+        threading.Thread(
+            target=self._prefetch_keys,
+            daemon=True,
+            name="wizard-key-prefetch",
+        ).start()
+
     # ================================================================== #
     # UI construction                                                      #
     # ================================================================== #
@@ -149,11 +596,22 @@ class SetupWizard(wx.Dialog):
         main_sizer.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 12)
 
         # --- Page container ---
-        self._page_panel = wx.Panel(self)
-        make_panel_accessible(self._page_panel)
-        self._page_sizer = wx.BoxSizer(wx.VERTICAL)
-        self._page_panel.SetSizer(self._page_sizer)
-        main_sizer.Add(self._page_panel, 1, wx.EXPAND | wx.ALL, 12)
+        # One panel per page; each is filled on first visit and then kept,
+        # so navigating Back/Next only switches the visible page.
+        self._book = wx.Simplebook(self)
+        self._pages: list[wx.Panel] = []
+        for idx, page_name in enumerate(_PAGE_NAMES):
+            page = wx.Panel(self._book)
+            make_panel_accessible(page)
+            # Each panel always holds the same page, so its name is set once
+            set_accessible_name(page, f"{page_name} — Step {idx + 1} of {_TOTAL_PAGES}")
+            page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self._book.AddPage(page, "")
+            self._pages.append(page)
+        self._built_pages: set[int] = set()
+        # First interactive control per page, recorded when the page is built
+        self._first_focus: list[wx.Window | None] = [None] * _TOTAL_PAGES
+        main_sizer.Add(self._book, 1, wx.EXPAND | wx.ALL, 12)
 
         # --- Progress indicator ---
         self._step_label = wx.StaticText(self, label="Step 1 of 6")
@@ -189,6 +647,8 @@ class SetupWizard(wx.Dialog):
         self._btn_next.Bind(wx.EVT_BUTTON, self._on_next)
         self._btn_skip.Bind(wx.EVT_BUTTON, self._on_skip)
         self._btn_finish.Bind(wx.EVT_BUTTON, self._on_finish)
+        self.Bind(wx.EVT_CLOSE, self._on_close)
+        self.Bind(wx.EVT_TIMER, self._on_gauge_timer, self._gauge_timer)
 
     # ================================================================== #
     # Page display                                                         #
@@ -201,49 +661,43 @@ class SetupWizard(wx.Dialog):
             page_idx: Zero-based page index.
         """
         self._current_page = page_idx
+        page = self._pages[page_idx]
 
-        # Clear previous page content
-        self._page_sizer.Clear(delete_windows=True)
-
-        # Build the requested page
-        page_names = {
-            PAGE_WELCOME: "Welcome page",
-            PAGE_MODE: "Experience mode page",
-            PAGE_HARDWARE: "Hardware detection page",
-            PAGE_MODELS: "Model selection page",
-            PAGE_PROVIDERS: "Cloud services setup page",
-            PAGE_AI_COPILOT: "AI and Copilot setup page",
-            PAGE_BUDGET: "Spending limits page",
-            PAGE_PREFERENCES: "Preferences page",
-            PAGE_SUMMARY: "Setup summary page",
-        }
-        builders = {
-            PAGE_WELCOME: self._build_welcome_page,
-            PAGE_MODE: self._build_mode_page,
-            PAGE_HARDWARE: self._build_hardware_page,
-            PAGE_MODELS: self._build_models_page,
-            PAGE_PROVIDERS: self._build_providers_page,
-            PAGE_AI_COPILOT: self._build_ai_copilot_page,
-            PAGE_BUDGET: self._build_budget_page,
-            PAGE_PREFERENCES: self._build_preferences_page,
-            PAGE_SUMMARY: self._build_summary_page,
-        }
-        builders[page_idx]()
-
-        # Update navigation state
-        self._update_nav_buttons()
-        step_text = f"Step {page_idx + 1} of {_TOTAL_PAGES}"
-        self._step_label.SetLabel(step_text)
-        set_accessible_name(self._step_label, step_text)
-        set_accessible_name(
-            self._page_panel,
-            f"{page_names.get(page_idx, 'Wizard page')} — {step_text}",
-        )
-        self._page_panel.Layout()
-        self.Layout()
-
-        # Set focus to first interactive control
-        wx.CallAfter(self._focus_first_control)
+        # Batch the rebuild into a single repaint
+        self.Freeze()
+        try:
+            # Build the requested page.  The summary reflects choices made on
+            # earlier pages, so it is rebuilt on every visit; all other pages
+            # are built only once.
+            if page_idx not in self._built_pages or page_idx == PAGE_SUMMARY:
+                page_sizer = page.GetSizer()
+                page_sizer.Clear(delete_windows=True)
+                self._builders[page_idx](page, page_sizer)
+                self._built_pages.add(page_idx)
+                self._first_focus[page_idx] = self._find_first_focus(page)
+            self._book.ChangeSelection(page_idx)
+
+            title, subtitle = _PAGE_HEADINGS[page_idx]
+            self._header.SetLabel(title)
+            self._subtitle.SetLabel(subtitle)
+
+            # Update navigation state
+            self._update_nav_buttons()
+            step_text = f"Step {page_idx + 1} of {_TOTAL_PAGES}"
+            self._step_label.SetLabel(step_text)
+            set_accessible_name(self._step_label, step_text)
+            page.Layout()
+            self.Layout()
+        finally:
+            self.Thaw()
+
+        # Set focus to first interactive control.  Navigation always runs on
+        # the UI thread, so focus is set directly; only the initial page,
+        # shown before the dialog is visible, waits for the event loop.
+        if self.IsShown():
+            self._focus_first_control()
+        else:
+            wx.CallAfter(self._focus_first_control)
 
     def _create_info_text(self, parent: wx.Window, text: str, name: str) -> wx.TextCtrl:
         """Create a focusable read-only text control for informational text.
@@ -267,25 +721,42 @@ class SetupWizard(wx.Dialog):
         ctrl.SetBackgroundColour(parent.GetBackgroundColour())
         set_accessible_name(ctrl, name)
         # Estimate the needed height based on text length
-        dc = wx.ClientDC(ctrl)
-        dc.SetFont(ctrl.GetFont())
-        line_h = dc.GetCharHeight()
-        avg_char_w = dc.GetCharWidth()
-        available_w = max(400, 600)
-        chars_per_line = max(1, available_w // avg_char_w)
-        total_lines = 0
-        for line in text.split("\n"):
-            total_lines += max(1, (len(line) + chars_per_line - 1) // chars_per_line)
+        line_h, avg_char_w = self._info_text_metrics(ctrl)
+        chars_per_line = max(1, 600 // avg_char_w)
+        total_lines = sum(
+            max(1, (len(line) + chars_per_line - 1) // chars_per_line) for line in text.split("\n")
+        )
         ctrl.SetMinSize((-1, total_lines * line_h + 10))
         return ctrl
 
+    def _info_text_metrics(self, ctrl: wx.TextCtrl) -> tuple[int, int]:
+        """Return the line height and average character width for info text.
+
+        All info text controls share the default font, so the metrics are
+        measured once with an off-screen DC and reused for every page.
+
+        Args:
+            ctrl: An info text control whose font is measured.
+
+        Returns:
+            Tuple of ``(line_height, average_char_width)`` in pixels.
+        """
+        if self._info_metrics is None:
+            dc = wx.MemoryDC()
+            dc.SetFont(ctrl.GetFont())
+            self._info_metrics = (dc.GetCharHeight(), max(1, dc.GetCharWidth()))
+        return self._info_metrics
+
+    def _find_first_focus(self, page: wx.Panel) -> wx.Window | None:
+        """Return the first interactive control on a freshly built page."""
+        for child in page.GetChildren():
+            if isinstance(child, (wx.Button, wx.CheckBox, wx.TextCtrl, wx.Choice, wx.ListCtrl)):
+                return child
+        return None
+
     def _focus_first_control(self) -> None:
         """Set focus to the first interactive control on the current page."""
-        for child in self._page_panel.GetChildren():
-            if isinstance(child, (wx.Button, wx.CheckBox, wx.TextCtrl, wx.Choice, wx.ListCtrl)):
-                child.SetFocus()
-                return
-        self._btn_next.SetFocus()
+        (self._first_focus[self._current_page] or self._btn_next).SetFocus()
 
     def _update_nav_buttons(self) -> None:
         """Show/hide navigation buttons based on current page."""
@@ -298,31 +769,10 @@ class SetupWizard(wx.Dialog):
     # Page 1: Welcome                                                      #
     # ================================================================== #
 
-    def _build_welcome_page(self) -> None:
+    def _build_welcome_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the welcome / introduction page."""
-        self._header.SetLabel(f"Welcome to {APP_NAME}!")
-        self._subtitle.SetLabel(
-            "Let's get you set up in just a few steps. This will only take a minute."
-        )
 
-        panel = self._page_panel
-        sizer = self._page_sizer
-
-        intro_text = (
-            f"{APP_NAME} turns your audio files into text using the latest AI technology. "
-            "You can use free on-device models that keep your data private, or connect "
-            "to cloud services for maximum accuracy.\n\n"
-            "This setup wizard will:\n"
-            "  1.  Let you choose Basic or Advanced mode\n"
-            "  2.  Detect your computer's hardware\n"
-            "  3.  Recommend AI models that work best on your machine\n"
-            "  4.  Let you download models for offline use\n"
-            "  5.  Help you connect cloud services (optional)\n"
-            "  6.  Set up AI features and spending limits\n"
-            "  7.  Set your preferences\n\n"
-            "You can always change these settings later from the Tools menu."
-        )
-        intro = self._create_info_text(panel, intro_text, "Setup wizard introduction")
+        intro = self._create_info_text(panel, _WELCOME_INTRO, "Setup wizard introduction")
         sizer.Add(intro, 0, wx.EXPAND | wx.ALL, 8)
 
         # Feature highlights
@@ -330,15 +780,7 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(features_box, "Feature highlights")
         fb_sizer = wx.StaticBoxSizer(features_box, wx.VERTICAL)
 
-        highlights = [
-            "16 transcription engines — cloud and local",
-            "14 AI models matched to your hardware",
-            "7 export formats (Text, Word, SRT, and more)",
-            "Full keyboard navigation and screen reader support",
-            "Your audio stays on your computer with local models",
-        ]
-        highlights_text = "\n".join(f"  \u2022  {h}" for h in highlights)
-        highlights_ctrl = self._create_info_text(panel, highlights_text, "Feature highlights")
+        highlights_ctrl = self._create_info_text(panel, _WELCOME_HIGHLIGHTS, "Feature highlights")
         fb_sizer.Add(highlights_ctrl, 0, wx.EXPAND | wx.ALL, 4)
 
         sizer.Add(fb_sizer, 0, wx.EXPAND | wx.ALL, 8)
@@ -347,22 +789,10 @@ class SetupWizard(wx.Dialog):
     # Page 2: Experience Mode                                              #
     # ================================================================== #
 
-    def _build_mode_page(self) -> None:
+    def _build_mode_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the experience mode selection page (Basic vs Advanced)."""
-        self._header.SetLabel("Choose Your Experience")
-        self._subtitle.SetLabel(
-            "Pick the interface style that suits you best. "
-            "You can switch at any time from the View menu."
-        )
 
-        panel = self._page_panel
-        sizer = self._page_sizer
-
-        intro_text = (
-            f"{APP_NAME} offers two experience modes to match your comfort level. "
-            "Choose Basic for a streamlined experience, or Advanced for full control."
-        )
-        intro = self._create_info_text(panel, intro_text, "Mode selection introduction")
+        intro = self._create_info_text(panel, _MODE_INTRO, "Mode selection introduction")
         sizer.Add(intro, 0, wx.EXPAND | wx.ALL, 8)
 
         # Basic mode box
@@ -378,17 +808,7 @@ class SetupWizard(wx.Dialog):
         )
         basic_sizer.Add(self._mode_basic, 0, wx.ALL, 4)
 
-        basic_features = (
-            "What you get in Basic mode:\n"
-            "  \u2022  Simple settings: General, Output, and Provider tabs\n"
-            "  \u2022  Only activated cloud providers appear for use\n"
-            "  \u2022  Guided provider setup via Add Provider wizard\n"
-            "  \u2022  Recommended defaults applied automatically\n"
-            "  \u2022  Clean, focused interface with fewer options\n\n"
-            "Best for: First-time users, accessibility-focused workflows, "
-            "and anyone who prefers simplicity."
-        )
-        basic_ctrl = self._create_info_text(panel, basic_features, "Basic mode features")
+        basic_ctrl = self._create_info_text(panel, _MODE_BASIC_FEATURES, "Basic mode features")
         basic_sizer.Add(basic_ctrl, 0, wx.EXPAND | wx.ALL, 4)
         sizer.Add(basic_sizer, 0, wx.EXPAND | wx.ALL, 4)
 
@@ -405,17 +825,7 @@ class SetupWizard(wx.Dialog):
         )
         adv_sizer.Add(self._mode_advanced, 0, wx.ALL, 4)
 
-        adv_features = (
-            "What you get in Advanced mode (everything in Basic, plus):\n"
-            "  \u2022  All 7 settings tabs including Audio Processing and Advanced\n"
-            "  \u2022  All cloud providers visible regardless of activation\n"
-            "  \u2022  Audio preprocessing chain (noise gate, EQ, compressor)\n"
-            "  \u2022  Concurrency, chunking, and GPU configuration\n"
-            "  \u2022  CPU thread and compute type controls\n"
-            "  \u2022  Log level and debug settings\n\n"
-            "Best for: Power users, audio professionals, and developers."
-        )
-        adv_ctrl = self._create_info_text(panel, adv_features, "Advanced mode features")
+        adv_ctrl = self._create_info_text(panel, _MODE_ADV_FEATURES, "Advanced mode features")
         adv_sizer.Add(adv_ctrl, 0, wx.EXPAND | wx.ALL, 4)
         sizer.Add(adv_sizer, 0, wx.EXPAND | wx.ALL, 4)
 
@@ -426,24 +836,15 @@ class SetupWizard(wx.Dialog):
             self._mode_basic.SetValue(True)
 
         # Tip
-        tip_text = (
-            "Tip: You can switch between Basic and Advanced mode at any time "
-            "using View > Advanced Mode (Ctrl+Shift+A) in the menu bar."
-        )
-        tip = self._create_info_text(panel, tip_text, "Mode switching tip")
+        tip = self._create_info_text(panel, _MODE_TIP, "Mode switching tip")
         sizer.Add(tip, 0, wx.EXPAND | wx.ALL, 8)
 
     # ================================================================== #
     # Page 3: Hardware Detection                                           #
     # ================================================================== #
 
-    def _build_hardware_page(self) -> None:
+    def _build_hardware_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the hardware detection results page."""
-        self._header.SetLabel("Your Computer")
-        self._subtitle.SetLabel("We've scanned your hardware to find the best AI models for you.")
-
-        panel = self._page_panel
-        sizer = self._page_sizer
 
         # Run hardware probe if not done yet
         if self._device_profile is None:
@@ -474,17 +875,20 @@ class SetupWizard(wx.Dialog):
             items.append(("Graphics Card:", "None detected (CPU-only mode)"))
 
         # Disk space
-        free_gb = get_free_disk_space_mb(MODELS_DIR) / 1024
+        free_gb = self._free_mb() / 1024
         items.append(("Free Disk Space:", f"{free_gb:.1f} GB"))
 
+        # Labels share one bold copy of the panel font; rows go in one call
+        bold_font = wx.Font(panel.GetFont())
+        bold_font.SetWeight(wx.FONTWEIGHT_BOLD)
+        rows: list[tuple[Any, ...]] = []
         for label_text, value_text in items:
             lbl = wx.StaticText(panel, label=label_text)
-            font = lbl.GetFont()
-            font.SetWeight(wx.FONTWEIGHT_BOLD)
-            lbl.SetFont(font)
+            lbl.SetFont(bold_font)
             val = wx.StaticText(panel, label=value_text)
-            grid.Add(lbl, 0, wx.ALIGN_RIGHT)
-            grid.Add(val, 0)
+            rows.append((lbl, 0, wx.ALIGN_RIGHT))
+            rows.append((val, 0))
+        grid.AddMany(rows)
 
         hw_sizer.Add(grid, 0, wx.ALL | wx.EXPAND, 8)
 
@@ -530,20 +934,12 @@ class SetupWizard(wx.Dialog):
     # Page 3: Model Selection & Download                                   #
     # ================================================================== #
 
-    def _build_models_page(self) -> None:
+    def _build_models_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the model selection page with download capabilities."""
-        self._header.SetLabel("Choose Your AI Models")
-        self._subtitle.SetLabel(
-            "Select which models to download for offline transcription. "
-            "You can always download more later."
-        )
-
-        panel = self._page_panel
-        sizer = self._page_sizer
         dp = self._device_profile
 
         # Disk space warning
-        free_mb = get_free_disk_space_mb(MODELS_DIR)
+        free_mb = self._free_mb()
         if free_mb < 1000:
             warn = wx.StaticText(
                 panel,
@@ -557,12 +953,10 @@ class SetupWizard(wx.Dialog):
             sizer.Add(warn, 0, wx.ALL, 4)
 
         # Recommended model callout
-        recommended = self._device_probe.get_recommended_model()
-        rec_info = None
-        for m in WHISPER_MODELS:
-            if m.id == recommended:
-                rec_info = m
-                break
+        if self._recommended_model is None:
+            self._recommended_model = self._device_probe.get_recommended_model()
+        recommended = self._recommended_model
+        rec_info = next((m for m in WHISPER_MODELS if m.id == recommended), None)
 
         if rec_info:
             rec_box = wx.StaticBox(panel, label="Recommended for Your Hardware")
@@ -587,15 +981,14 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(scroll, "Available models list")
         scroll_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        self._model_checks: dict[str, wx.CheckBox] = {}
-        self._model_status_labels: dict[str, wx.StaticText] = {}
+        # Snapshot the profile lists once for O(1) membership tests
+        ineligible = frozenset(dp.ineligible_models) if dp else frozenset()
+        warned = frozenset(dp.warned_models) if dp else frozenset()
 
         for mi in WHISPER_MODELS:
-            if not dp or mi.id in dp.ineligible_models:
+            if not dp or mi.id in ineligible:
                 continue
 
-            row = wx.BoxSizer(wx.HORIZONTAL)
-
             # Checkbox
             already_downloaded = self._model_manager.is_downloaded(mi.id)
             cb = wx.CheckBox(scroll, label="")
@@ -612,12 +1005,9 @@ class SetupWizard(wx.Dialog):
                 cb.SetValue(True)
                 cb.Disable()
 
-            self._model_checks[mi.id] = cb
-            row.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
-
             # Model info
             eligibility = ""
-            if mi.id in (dp.warned_models if dp else []):
+            if mi.id in warned:
                 eligibility = " (Warning: May be slow)"
 
             info_text = (
@@ -627,14 +1017,18 @@ class SetupWizard(wx.Dialog):
                 f"{eligibility}"
             )
             info_lbl = wx.StaticText(scroll, label=info_text)
-            row.Add(info_lbl, 1, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
 
             # Status label
             status_text = "Downloaded" if already_downloaded else ""
-            status_lbl = wx.StaticText(scroll, label=status_text)
-            self._model_status_labels[mi.id] = status_lbl
-            row.Add(status_lbl, 0, wx.ALIGN_CENTER_VERTICAL)
-
+            status_lbl = wx.StaticText(scroll, label=status_text, style=wx.ST_NO_AUTORESIZE)
+            status_lbl.SetMinSize((status_lbl.GetTextExtent("Downloading...")[0], -1))
+            self._model_rows[mi.id] = _ModelRow(cb, status_lbl, status_text)
+
+            row = _row(
+                (cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4),
+                (info_lbl, 1, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8),
+                (status_lbl, 0, wx.ALIGN_CENTER_VERTICAL),
+            )
             scroll_sizer.Add(row, 0, wx.EXPAND | wx.ALL, 3)
 
             # Checkbox event
@@ -672,8 +1066,8 @@ class SetupWizard(wx.Dialog):
 
     def _on_model_toggle(self, model_id: str) -> None:
         """Handle model checkbox toggle."""
-        cb = self._model_checks.get(model_id)
-        if cb and cb.GetValue():
+        row = self._model_rows.get(model_id)
+        if row and row.checkbox.GetValue():
             if model_id not in self._selected_models:
                 self._selected_models.append(model_id)
         else:
@@ -685,8 +1079,9 @@ class SetupWizard(wx.Dialog):
         """Update the total download size label."""
         total_mb = 0
         count = 0
+        downloaded = self._model_manager.downloaded_ids()
         for mid in self._selected_models:
-            if not self._model_manager.is_downloaded(mid):
+            if mid not in downloaded:
                 for m in WHISPER_MODELS:
                     if m.id == mid:
                         total_mb += m.disk_size_mb
@@ -701,22 +1096,82 @@ class SetupWizard(wx.Dialog):
             text = f"{count} model(s) selected — {total_mb} MB to download"
 
         # Disk space check
-        free_mb = get_free_disk_space_mb(MODELS_DIR)
+        free_mb = self._free_mb()
         if total_mb > 0 and total_mb > free_mb * 0.9:
             text += f"  \u26a0 Not enough disk space! ({free_mb:.0f} MB free)"
 
-        if hasattr(self, "_size_label"):
+        if self._size_label is not None:
             self._size_label.SetValue(text)
             set_accessible_name(self._size_label, f"Download summary: {text}")
 
-    def _on_download_selected(self, _event: wx.CommandEvent) -> None:
-        """Start downloading all selected models asynchronously."""
-        # Pre-check: is faster-whisper installed?
+    def _get_key(self, provider: str) -> str:
+        """Return the API key for *provider*, or ``""``.
+
+        A key entered earlier in this wizard session wins over the stored one;
+        stored keys are read through the session cache.
+        """
+        staged = self._provider_keys.get(provider)
+        if staged:
+            return staged
+        if provider not in self._key_cache:
+            self._key_cache[provider] = self._key_store.get_key(provider) or ""
+        return self._key_cache[provider]
+
+    def _stage_keys(self, keys: dict[str, str]) -> None:
+        """Remember keys entered in the wizard until the user clicks Finish.
+
+        Nothing reaches the OS keyring here, so skipping or closing the
+        wizard leaves stored keys untouched.
+
+        Args:
+            keys: Mapping of provider identifier to the API key entered.
+        """
+        self._provider_keys.update(keys)
+
+    def _commit_keys(self) -> None:
+        """Store all staged keys in one keyring batch, skipping unchanged ones."""
+        changed = {p: v for p, v in self._provider_keys.items() if self._key_cache.get(p) != v}
+        if changed:
+            self._key_store.store_keys_batch(changed)
+            self._key_cache.update(changed)
+
+    def _prefetch_keys(self) -> None:
+        """Read every provider key into the session cache (worker thread)."""
+        for provider, value in self._key_store.get_keys(_PROVIDER_KEY_IDS).items():
+            # setdefault keeps anything _get_key or _commit_keys cached meanwhile
+            self._key_cache.setdefault(provider, value or "")
+
+    def _free_mb(self) -> float:
+        """Return free space on the models volume, re-measured at most every few seconds."""
+        now = time.monotonic()
+        if now - self._free_mb_ts > _FREE_SPACE_TTL_S:
+            self._free_mb_val = get_free_disk_space_mb(MODELS_DIR)
+            self._free_mb_ts = now
+        return self._free_mb_val
+
+    def _preload_faster_whisper(self) -> None:
+        """Import faster-whisper and record whether it is available."""
         try:
             import faster_whisper
 
             _ = faster_whisper  # availability check
+            self._fw_available = True
         except ImportError:
+            self._fw_available = False
+
+    def _preload_copilot_sdk(self) -> None:
+        """Import the Copilot SDK and record whether it is available."""
+        from bits_whisperer.core.sdk_installer import is_sdk_available
+
+        self._copilot_sdk_ok = is_sdk_available("copilot_sdk")
+
+    def _on_download_selected(self, _event: wx.CommandEvent) -> None:
+        """Start downloading all selected models asynchronously."""
+        # Pre-check: is faster-whisper installed?
+        if self._fw_available is None:
+            # Background preload hasn't finished yet — check synchronously
+            self._preload_faster_whisper()
+        if not self._fw_available:
             accessible_message_box(
                 "The faster-whisper library is not installed.\n\n"
                 "Install it with:\n"
@@ -741,15 +1196,11 @@ class SetupWizard(wx.Dialog):
             return
 
         # Disk space pre-check
-        total_mb = 0
-        for mid in to_download:
-            for m in WHISPER_MODELS:
-                if m.id == mid:
-                    total_mb += m.disk_size_mb
-                    break
-
-        if not has_sufficient_disk_space(MODELS_DIR, total_mb * 1.1):
-            free_mb = get_free_disk_space_mb(MODELS_DIR)
+        sizes_mb = {m.id: m.disk_size_mb for m in WHISPER_MODELS if m.id in to_download}
+        total_mb = sum(sizes_mb.values())
+
+        free_mb = self._free_mb()
+        if free_mb < total_mb * 1.1:
             accessible_message_box(
                 f"Not enough disk space!\n\n"
                 f"Required: {total_mb} MB\n"
@@ -761,38 +1212,126 @@ class SetupWizard(wx.Dialog):
             )
             return
 
+        # The gauge counts megabytes so large models weigh more than small ones
         self._dl_all_btn.Disable()
+        self._dl_gauge.SetRange(max(1, total_mb))
+        self._dl_gauge.SetValue(0)
         self._dl_gauge.Show()
-        self._dl_gauge.Pulse()
         self.Layout()
 
-        # Download each model in a background thread
+        # Download the models on the bounded background pool
         self._downloads_total = len(to_download)
         self._downloads_done = 0
-
+        self._success_count = 0
+        self._failed_count = 0
+        self._completion_shown = False
+        self._dl_sizes_mb = sizes_mb
+        self._dl_progress = dict.fromkeys(to_download, 0.0)
+        self._gauge_timer.Start(100)
+
+        needs_layout = False
         for model_id in to_download:
-            self._download_status[model_id] = "Downloading..."
-            self._update_model_status(model_id, "Downloading...")
-
-            t = threading.Thread(
-                target=self._download_model_async,
-                args=(model_id,),
-                daemon=True,
-                name=f"dl-{model_id}",
+            self._model_rows[model_id].status = "Downloading..."
+            needs_layout |= self._update_model_status(model_id, "Downloading...")
+
+            future = self._dl_executor.submit(
+                self._model_manager.download_model, model_id, self._on_download_progress
             )
-            self._download_threads[model_id] = t
-            t.start()
+            future.add_done_callback(functools.partial(self._on_download_done, model_id))
+            self._dl_futures[model_id] = future
+        if needs_layout:
+            self._pages[PAGE_MODELS].Layout()
+
+    def _on_download_progress(self, model_id: str, progress: float) -> None:
+        """Record download progress for the gauge timer.
 
-    def _download_model_async(self, model_id: str) -> None:
-        """Download a model in a background thread.
+        Called on the worker thread; the UI is only touched by the timer.
 
         Args:
-            model_id: The model identifier to download.
+            model_id: The model being downloaded.
+            progress: Percentage complete (0–100).
         """
+        self._dl_progress[model_id] = progress
+
+    def _on_gauge_timer(self, _event: wx.TimerEvent) -> None:
+        """Draw pending status changes and the combined progress once per tick."""
+        if self._pending_status:
+            self._flush_status()
+        if not self._dl_progress:
+            return
+        sizes = self._dl_sizes_mb
+        done_mb = sum(sizes.get(mid, 0) * pct for mid, pct in self._dl_progress.items()) / 100
+        self._dl_gauge.SetValue(int(done_mb))
+
+    def _finalize_downloads(self) -> None:
+        """Restore the models page and report the batch once every download is done."""
+        # A stray CallAfter can still arrive inside the modal summary's event
+        # loop, so only report once per batch.
+        if self._completion_shown:
+            return
+        self._completion_shown = True
+        self._gauge_timer.Stop()
+        if self._pending_status:
+            self._flush_status()
+        self._dl_gauge.Hide()
+        self._dl_all_btn.Enable()
+        self._dl_all_btn.SetLabel("&Download Selected Models Now")
+        self.Layout()
+
+        # Show completion notification
+        failed = self._failed_count
+        if failed == 0:
+            accessible_message_box(
+                f"All {self._downloads_total} model(s) downloaded successfully!\n\n"
+                "You're all set for offline transcription.",
+                "Downloads Complete",
+                wx.OK | wx.ICON_INFORMATION,
+                self,
+            )
+        else:
+            accessible_message_box(
+                f"Downloaded: {self._success_count}\n"
+                f"Failed: {failed}\n\n"
+                "You can retry failed downloads later from Tools, then Manage Models.",
+                "Downloads Complete",
+                wx.OK | wx.ICON_WARNING,
+                self,
+            )
+
+    def _flush_status(self) -> None:
+        """Apply all queued model status changes with a single repaint."""
+        page = self._pages[PAGE_MODELS]
+        needs_layout = False
+        page.Freeze()
         try:
-            self._model_manager.download_model(model_id)
+            for model_id, status in self._pending_status.items():
+                needs_layout |= self._update_model_status(model_id, status)
+                if status == "Downloaded":
+                    # Lock the checkbox of a model that is now on disk
+                    cb = self._model_rows[model_id].checkbox
+                    cb.SetValue(True)
+                    cb.Disable()
+            self._pending_status.clear()
+        finally:
+            page.Thaw()
+        if needs_layout:
+            page.Layout()
+
+    def _on_download_done(self, model_id: str, future: Future[Path]) -> None:
+        """Forward a finished download to the main thread.
+
+        Called on the worker thread that ran the download.
+
+        Args:
+            model_id: The model identifier that was downloaded.
+            future: The completed download future.
+        """
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
             safe_call_after(self._on_model_downloaded, model_id, True, "")
-        except Exception as exc:
+        else:
             safe_call_after(self._on_model_downloaded, model_id, False, str(exc))
 
     def _on_model_downloaded(self, model_id: str, success: bool, error: str) -> None:
@@ -804,81 +1343,53 @@ class SetupWizard(wx.Dialog):
             error: Error message if failed.
         """
         self._downloads_done += 1
+        self._dl_progress[model_id] = 100.0
+        self._dl_futures.pop(model_id, None)
 
+        # Widgets are updated in a batch by the next gauge timer tick
+        row = self._model_rows[model_id]
         if success:
-            self._download_status[model_id] = "Downloaded"
-            self._update_model_status(model_id, "Downloaded")
-
-            # Disable checkbox for downloaded model
-            cb = self._model_checks.get(model_id)
-            if cb:
-                cb.SetValue(True)
-                cb.Disable()
-
+            self._success_count += 1
+            self._free_mb_ts = 0.0  # the model now occupies disk; re-measure next time
+            row.status = "Downloaded"
+            self._pending_status[model_id] = "Downloaded"
             logger.info("Wizard: model '%s' downloaded successfully", model_id)
         else:
-            self._download_status[model_id] = f"Failed: {error}"
-            self._update_model_status(model_id, f"Failed: {error[:50]}")
+            self._failed_count += 1
+            row.status = f"Failed: {error}"
+            self._pending_status[model_id] = f"Failed: {error[:50]}"
             logger.warning("Wizard: model '%s' download failed: %s", model_id, error)
 
-        # Update progress
-        if self._downloads_total > 0:
-            pct = int(self._downloads_done / self._downloads_total * 100)
-            self._dl_gauge.SetValue(pct)
-
-        # All done?
-        if self._downloads_done >= self._downloads_total:
-            self._dl_gauge.Hide()
-            self._dl_all_btn.Enable()
-            self._dl_all_btn.SetLabel("&Download Selected Models Now")
-            self.Layout()
+        if self._downloads_done == self._downloads_total:
+            # Let queued UI events drain before the modal summary opens
+            wx.CallAfter(self._finalize_downloads)
 
-            # Show completion notification
-            failed = sum(1 for s in self._download_status.values() if s.startswith("Failed"))
-            if failed == 0:
-                accessible_message_box(
-                    f"All {self._downloads_total} model(s) downloaded successfully!\n\n"
-                    "You're all set for offline transcription.",
-                    "Downloads Complete",
-                    wx.OK | wx.ICON_INFORMATION,
-                    self,
-                )
-            else:
-                accessible_message_box(
-                    f"Downloaded: {self._downloads_total - failed}\n"
-                    f"Failed: {failed}\n\n"
-                    "You can retry failed downloads later from Tools, then Manage Models.",
-                    "Downloads Complete",
-                    wx.OK | wx.ICON_WARNING,
-                    self,
-                )
-
-    def _update_model_status(self, model_id: str, status: str) -> None:
+    def _update_model_status(self, model_id: str, status: str) -> bool:
         """Update the status label for a model.
 
+        Status labels reserve room for the usual texts, so the page only
+        needs a new layout when a longer message (such as an error) arrives.
+
         Args:
             model_id: Model identifier.
             status: Status text to display.
+
+        Returns:
+            True if the label outgrew its slot and the page must be laid out.
         """
-        lbl = self._model_status_labels.get(model_id)
-        if lbl:
-            lbl.SetLabel(status)
-            self._page_panel.Layout()
+        row = self._model_rows.get(model_id)
+        if not row:
+            return False
+        lbl = row.status_label
+        lbl.SetLabel(status)
+        return lbl.GetBestSize().width > lbl.GetSize().width
 
     # ================================================================== #
     # Page 4: Provider Selection & API Keys                                #
     # ================================================================== #
 
-    def _build_providers_page(self) -> None:
+    def _build_providers_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the cloud provider setup page."""
-        self._header.SetLabel("Cloud Services (Optional)")
-        self._subtitle.SetLabel(
-            "Connect cloud transcription services for maximum accuracy. "
-            "You can skip this and use free local models."
-        )
-
-        panel = self._page_panel
-        sizer = self._page_sizer
 
         intro_text = (
             "Cloud services are optional — local models work great for most uses."
@@ -895,111 +1406,96 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(scroll, "Cloud provider API keys")
         scroll_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        # Provider info: (key_id, display_name, help_url, description)
-        providers = [
-            (
-                "openai",
-                "OpenAI (Whisper API)",
-                "https://platform.openai.com/api-keys",
-                "Fast and reliable. $0.006/min.",
-            ),
-            (
-                "groq",
-                "Groq (LPU Whisper)",
-                "https://console.groq.com/keys",
-                "188x real-time speed. $0.003/min.",
-            ),
-            (
-                "gemini",
-                "Google Gemini",
-                "https://makersuite.google.com/app/apikey",
-                "Cheapest cloud option. $0.0002/min.",
-            ),
-            (
-                "deepgram",
-                "Deepgram (Nova-2)",
-                "https://console.deepgram.com/",
-                "Smart formatting. $0.013/min.",
-            ),
-            (
-                "assemblyai",
-                "AssemblyAI",
-                "https://www.assemblyai.com/app/account",
-                "Speaker labels, auto-chapters. $0.011/min.",
-            ),
-            (
-                "elevenlabs",
-                "ElevenLabs (Scribe)",
-                "https://elevenlabs.io/app/settings/api-keys",
-                "99+ languages. $0.005/min.",
-            ),
-            (
-                "auphonic",
-                "Auphonic",
-                "https://auphonic.com/accounts/settings/#api-key",
-                "Audio post-production + Whisper. 2 free hours/month.",
-            ),
-        ]
-
-        self._provider_inputs: dict[str, wx.TextCtrl] = {}
-
-        for key_id, name, url, desc in providers:
-            box = wx.StaticBox(scroll, label=name)
-            set_accessible_name(box, f"{name} configuration")
-            box_sizer = wx.StaticBoxSizer(box, wx.VERTICAL)
-
-            desc_lbl = wx.StaticText(scroll, label=desc)
-            box_sizer.Add(desc_lbl, 0, wx.ALL, 2)
-
-            row = wx.BoxSizer(wx.HORIZONTAL)
-            lbl = wx.StaticText(scroll, label="API Key:")
-            txt = wx.TextCtrl(scroll, style=wx.TE_PASSWORD, size=(350, -1))
-            set_accessible_name(txt, f"{name} API key")
-            set_accessible_help(txt, f"Enter your {name} API key. Get one at {url}")
+        self._provider_inputs = {}
 
-            # Pre-fill from keystore
-            existing = self._key_store.get_key(key_id)
-            if existing:
-                txt.SetValue(existing)
-
-            self._provider_inputs[key_id] = txt
-            label_control(lbl, txt)
-            row.Add(lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
-            row.Add(txt, 1, wx.RIGHT, 4)
+        # Each provider is a collapsed pane whose key field is only created
+        # when the user expands it; providers with a saved key start open.
+        for provider in _PROVIDER_METADATA:
+            key_id, name = provider[0], provider[1]
+            pane = wx.CollapsiblePane(
+                scroll, label=name, style=wx.CP_DEFAULT_STYLE | wx.CP_NO_TLW_RESIZE
+            )
+            set_accessible_name(pane, f"{name} configuration")
+            scroll_sizer.Add(pane, 0, wx.EXPAND | wx.BOTTOM, 6)
+            pane.Bind(
+                wx.EVT_COLLAPSIBLEPANE_CHANGED,
+                lambda evt, p=pane, prov=provider: self._on_provider_pane_changed(evt, p, prov),
+            )
+            if self._get_key(key_id):
+                self._build_provider_pane(pane, provider)
+                pane.Expand()
 
-            # Link to get key
-            link = wx.adv.HyperlinkCtrl(scroll, label="Get key", url=url)
-            set_accessible_name(link, f"Open {name} key page")
-            row.Add(link, 0, wx.ALIGN_CENTER_VERTICAL)
+        scroll.SetSizer(scroll_sizer)
+        sizer.Add(scroll, 1, wx.EXPAND | wx.ALL, 4)
 
-            box_sizer.Add(row, 0, wx.EXPAND | wx.ALL, 2)
+    def _build_provider_pane(
+        self, pane: wx.CollapsiblePane, provider: tuple[str, str, str, str]
+    ) -> None:
+        """Create the key entry controls inside a provider's collapsible pane.
 
-            # Status indicator
-            if existing:
-                status = wx.StaticText(scroll, label="  Key saved")
-            else:
-                status = wx.StaticText(scroll, label="  Not configured (optional)")
-            box_sizer.Add(status, 0, wx.LEFT | wx.BOTTOM, 2)
+        Args:
+            pane: The provider's collapsible pane.
+            provider: The provider's ``_PROVIDER_METADATA`` entry.
+        """
+        key_id, name, url, desc = provider
+        win = pane.GetPane()
+        box_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        desc_lbl = wx.StaticText(win, label=desc)
+        box_sizer.Add(desc_lbl, 0, wx.ALL, 2)
+
+        lbl = wx.StaticText(win, label="API Key:")
+        txt = wx.TextCtrl(win, style=wx.TE_PASSWORD, size=(350, -1))
+        set_accessible_name(txt, f"{name} API key")
+        set_accessible_help(txt, f"Enter your {name} API key. Get one at {url}")
+
+        # Pre-fill from keystore
+        existing = self._get_key(key_id)
+        if existing:
+            txt.SetValue(existing)
+
+        self._provider_inputs[key_id] = txt
+        label_control(lbl, txt)
+
+        # Link to get key
+        link = _make_link(win, url, f"Open {name} key page")
+        row = _row(
+            (lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4),
+            (txt, 1, wx.RIGHT, 4),
+            (link, 0, wx.ALIGN_CENTER_VERTICAL),
+        )
 
-            scroll_sizer.Add(box_sizer, 0, wx.EXPAND | wx.BOTTOM, 6)
+        box_sizer.Add(row, 0, wx.EXPAND | wx.ALL, 2)
 
-        scroll.SetSizer(scroll_sizer)
-        sizer.Add(scroll, 1, wx.EXPAND | wx.ALL, 4)
+        # Status indicator
+        if existing:
+            status = wx.StaticText(win, label="  Key saved")
+        else:
+            status = wx.StaticText(win, label="  Not configured (optional)")
+        box_sizer.Add(status, 0, wx.LEFT | wx.BOTTOM, 2)
+
+        win.SetSizer(box_sizer)
+
+    def _on_provider_pane_changed(
+        self,
+        event: wx.CollapsiblePaneEvent,
+        pane: wx.CollapsiblePane,
+        provider: tuple[str, str, str, str],
+    ) -> None:
+        """Build a provider's controls on first expansion and re-flow the list."""
+        if not event.GetCollapsed() and provider[0] not in self._provider_inputs:
+            self._build_provider_pane(pane, provider)
+        scroll = pane.GetParent()
+        scroll.Layout()
+        scroll.FitInside()
+        event.Skip()
 
     # ================================================================== #
     # Page 5: AI & Copilot Setup                                           #
     # ================================================================== #
 
-    def _build_ai_copilot_page(self) -> None:
+    def _build_ai_copilot_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the AI provider and GitHub Copilot configuration page."""
-        self._header.SetLabel("AI Features (Optional)")
-        self._subtitle.SetLabel(
-            "Enhance your transcripts with AI-powered summarization, "
-            "translation, and interactive Q&A."
-        )
-
-        panel = self._page_panel
-        sizer = self._page_sizer
 
         intro_text = (
             "BITS Whisperer can use AI services to summarize, translate, and "
@@ -1029,25 +1525,25 @@ class SetupWizard(wx.Dialog):
         )
         gemini_sizer.Add(gemini_desc, 0, wx.ALL, 4)
 
-        g_row = wx.BoxSizer(wx.HORIZONTAL)
         g_lbl = wx.StaticText(scroll, label="Gemini API Key:")
         self._wizard_gemini_key = wx.TextCtrl(scroll, style=wx.TE_PASSWORD, size=(300, -1))
         set_accessible_name(self._wizard_gemini_key, "Google Gemini API key")
         label_control(g_lbl, self._wizard_gemini_key)
 
-        existing_gemini = self._key_store.get_key("gemini")
+        existing_gemini = self._get_key("gemini")
         if existing_gemini:
             self._wizard_gemini_key.SetValue(existing_gemini)
 
-        g_link = wx.adv.HyperlinkCtrl(
+        g_link = _make_link(
             scroll,
-            label="Get key",
-            url="https://makersuite.google.com/app/apikey",
+            "https://makersuite.google.com/app/apikey",
+            "Open Google AI Studio to get API key",
+        )
+        g_row = _row(
+            (g_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4),
+            (self._wizard_gemini_key, 1, wx.RIGHT, 4),
+            (g_link, 0, wx.ALIGN_CENTER_VERTICAL),
         )
-        set_accessible_name(g_link, "Open Google AI Studio to get API key")
-        g_row.Add(g_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
-        g_row.Add(self._wizard_gemini_key, 1, wx.RIGHT, 4)
-        g_row.Add(g_link, 0, wx.ALIGN_CENTER_VERTICAL)
         gemini_sizer.Add(g_row, 0, wx.EXPAND | wx.ALL, 4)
         scroll_sizer.Add(gemini_sizer, 0, wx.EXPAND | wx.BOTTOM, 8)
 
@@ -1067,9 +1563,10 @@ class SetupWizard(wx.Dialog):
         copilot_sizer.Add(copilot_desc, 0, wx.ALL, 4)
 
         # SDK detection status
-        from bits_whisperer.core.sdk_installer import is_sdk_available
-
-        sdk_ok = is_sdk_available("copilot_sdk")
+        if self._copilot_sdk_ok is None:
+            # Background preload hasn't finished yet — check synchronously
+            self._preload_copilot_sdk()
+        sdk_ok = self._copilot_sdk_ok
         if sdk_ok:
             sdk_status = "Copilot SDK: Installed (includes CLI)"
         else:
@@ -1102,25 +1599,25 @@ class SetupWizard(wx.Dialog):
         )
         openai_sizer.Add(openai_desc, 0, wx.ALL, 4)
 
-        o_row = wx.BoxSizer(wx.HORIZONTAL)
         o_lbl = wx.StaticText(scroll, label="OpenAI API Key:")
         self._wizard_openai_key = wx.TextCtrl(scroll, style=wx.TE_PASSWORD, size=(300, -1))
         set_accessible_name(self._wizard_openai_key, "OpenAI API key for AI features")
         label_control(o_lbl, self._wizard_openai_key)
 
-        existing_openai = self._key_store.get_key("openai")
+        existing_openai = self._get_key("openai")
         if existing_openai:
             self._wizard_openai_key.SetValue(existing_openai)
 
-        o_link = wx.adv.HyperlinkCtrl(
+        o_link = _make_link(
             scroll,
-            label="Get key",
-            url="https://platform.openai.com/api-keys",
+            "https://platform.openai.com/api-keys",
+            "Open OpenAI API keys page",
+        )
+        o_row = _row(
+            (o_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4),
+            (self._wizard_openai_key, 1, wx.RIGHT, 4),
+            (o_link, 0, wx.ALIGN_CENTER_VERTICAL),
         )
-        set_accessible_name(o_link, "Open OpenAI API keys page")
-        o_row.Add(o_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
-        o_row.Add(self._wizard_openai_key, 1, wx.RIGHT, 4)
-        o_row.Add(o_link, 0, wx.ALIGN_CENTER_VERTICAL)
         openai_sizer.Add(o_row, 0, wx.EXPAND | wx.ALL, 4)
         scroll_sizer.Add(openai_sizer, 0, wx.EXPAND | wx.BOTTOM, 8)
 
@@ -1131,13 +1628,8 @@ class SetupWizard(wx.Dialog):
     # Page 7: Spending Limits / Budget                                     #
     # ================================================================== #
 
-    def _build_budget_page(self) -> None:
+    def _build_budget_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the spending-limits / budget configuration page."""
-        self._header.SetLabel("Spending Limits")
-        self._subtitle.SetLabel("Control how much you spend on paid cloud transcription services.")
-
-        panel = self._page_panel
-        sizer = self._page_sizer
         b = self._settings.budget
 
         intro_text = (
@@ -1188,7 +1680,6 @@ class SetupWizard(wx.Dialog):
         ctrl_sizer.Add(self._wiz_always_confirm, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 6)
 
         # Default limit
-        lim_row = wx.BoxSizer(wx.HORIZONTAL)
         lim_lbl = wx.StaticText(panel, label="Default spending &limit (USD):")
         self._wiz_budget_limit = wx.SpinCtrlDouble(
             panel,
@@ -1203,8 +1694,9 @@ class SetupWizard(wx.Dialog):
             self._wiz_budget_limit,
             "Maximum cost in USD per transcription. " "Set to 0 for no limit.",
         )
-        lim_row.Add(lim_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
-        lim_row.Add(self._wiz_budget_limit, 0)
+        lim_row = _row(
+            (lim_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8), (self._wiz_budget_limit, 0)
+        )
         ctrl_sizer.Add(lim_row, 0, wx.ALL, 6)
 
         sizer.Add(ctrl_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 8)
@@ -1214,19 +1706,7 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(pricing_box, "Provider pricing reference")
         pr_sizer = wx.StaticBoxSizer(pricing_box, wx.VERTICAL)
 
-        pricing_lines = [
-            "Gemini:            ~$0.0002/min  (cheapest)",
-            "Groq Whisper:      ~$0.003/min",
-            "ElevenLabs Scribe: ~$0.005/min",
-            "OpenAI Whisper:    ~$0.006/min",
-            "AssemblyAI:        ~$0.011/min",
-            "Deepgram Nova-2:   ~$0.013/min",
-            "Azure Speech:      ~$0.017/min",
-            "Auphonic:          2 free hours/month, then paid",
-            "Local models:      Always free",
-        ]
-        pricing_text = "\n".join(pricing_lines)
-        pricing_ctrl = self._create_info_text(panel, pricing_text, "Provider pricing reference")
+        pricing_ctrl = self._create_info_text(panel, _PRICING_TEXT, "Provider pricing reference")
         pr_sizer.Add(pricing_ctrl, 0, wx.EXPAND | wx.ALL, 4)
 
         sizer.Add(pr_sizer, 0, wx.EXPAND | wx.ALL, 8)
@@ -1235,13 +1715,8 @@ class SetupWizard(wx.Dialog):
     # Page 8: Quick Preferences                                            #
     # ================================================================== #
 
-    def _build_preferences_page(self) -> None:
+    def _build_preferences_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the quick preferences page."""
-        self._header.SetLabel("Your Preferences")
-        self._subtitle.SetLabel("Customize how BITS Whisperer works for you.")
-
-        panel = self._page_panel
-        sizer = self._page_sizer
 
         s = self._settings
 
@@ -1250,31 +1725,16 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(lang_box, "Language preferences")
         lang_sizer = wx.StaticBoxSizer(lang_box, wx.VERTICAL)
 
-        lang_row = wx.BoxSizer(wx.HORIZONTAL)
         lang_lbl = wx.StaticText(panel, label="Primary &language:")
         self._pref_language = wx.Choice(
             panel,
-            choices=[
-                "Auto-detect",
-                "English",
-                "Spanish",
-                "French",
-                "German",
-                "Italian",
-                "Portuguese",
-                "Dutch",
-                "Russian",
-                "Chinese",
-                "Japanese",
-                "Korean",
-                "Arabic",
-                "Hindi",
-            ],
+            choices=_LANGUAGE_CHOICES,
         )
         label_control(lang_lbl, self._pref_language)
         self._pref_language.SetSelection(0)
-        lang_row.Add(lang_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
-        lang_row.Add(self._pref_language, 0)
+        lang_row = _row(
+            (lang_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8), (self._pref_language, 0)
+        )
         lang_sizer.Add(lang_row, 0, wx.ALL, 6)
         sizer.Add(lang_sizer, 0, wx.EXPAND | wx.ALL, 4)
 
@@ -1283,16 +1743,11 @@ class SetupWizard(wx.Dialog):
         set_accessible_name(out_box, "Output preferences")
         out_sizer = wx.StaticBoxSizer(out_box, wx.VERTICAL)
 
-        fmt_row = wx.BoxSizer(wx.HORIZONTAL)
         fmt_lbl = wx.StaticText(panel, label="Default export &format:")
-        self._pref_format = wx.Choice(
-            panel,
-            choices=["Plain Text (.txt)", "Markdown (.md)", "Word (.docx)", "SRT Subtitles (.srt)"],
-        )
+        self._pref_format = wx.Choice(panel, choices=_FORMAT_CHOICES)
         label_control(fmt_lbl, self._pref_format)
         self._pref_format.SetSelection(0)
-        fmt_row.Add(fmt_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
-        fmt_row.Add(self._pref_format, 0)
+        fmt_row = _row((fmt_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8), (self._pref_format, 0))
         out_sizer.Add(fmt_row, 0, wx.ALL, 6)
 
         self._pref_auto_export = wx.CheckBox(
@@ -1337,15 +1792,8 @@ class SetupWizard(wx.Dialog):
     # Page 9: Summary & Finish                                             #
     # ================================================================== #
 
-    def _build_summary_page(self) -> None:
+    def _build_summary_page(self, panel: wx.Panel, sizer: wx.BoxSizer) -> None:
         """Build the final summary page."""
-        self._header.SetLabel("You're All Set!")
-        self._subtitle.SetLabel(
-            "Here's a summary of your setup. Click Finish to start using " f"{APP_NAME}."
-        )
-
-        panel = self._page_panel
-        sizer = self._page_sizer
 
         # Hardware summary
         dp = self._device_profile
@@ -1363,16 +1811,8 @@ class SetupWizard(wx.Dialog):
         providers_configured = list(self._provider_keys.keys())
         # Also check keystore for keys set before this wizard session
         if not providers_configured:
-            for key_id in [
-                "openai",
-                "groq",
-                "gemini",
-                "deepgram",
-                "assemblyai",
-                "elevenlabs",
-                "auphonic",
-            ]:
-                if self._key_store.get_key(key_id):
+            for key_id in _PROVIDER_KEY_IDS:
+                if self._get_key(key_id):
                     providers_configured.append(key_id)
         providers_text = (
             ", ".join(providers_configured) if providers_configured else "None (using local models)"
@@ -1484,110 +1924,115 @@ class SetupWizard(wx.Dialog):
         )
         if dlg.ShowModal() == wx.ID_YES:
             mark_wizard_complete()
+            self._shutdown_downloads(cancel=True)
             self.EndModal(wx.ID_CANCEL)
         dlg.Destroy()
 
+    def _on_close(self, event: wx.CloseEvent) -> None:
+        """Drop queued downloads when the wizard is closed without finishing."""
+        self._shutdown_downloads(cancel=True)
+        event.Skip()
+
     def _on_finish(self, _event: wx.CommandEvent) -> None:
         """Finish the wizard, apply all settings."""
         self._save_current_page_state()
         self._apply_all_settings()
         mark_wizard_complete()
+        # Downloads the user already started keep running in the background
+        self._shutdown_downloads(cancel=False)
         self.EndModal(wx.ID_OK)
 
+    def _shutdown_downloads(self, cancel: bool) -> None:
+        """Stop the progress timer and release the download pool.
+
+        Args:
+            cancel: If True, drop downloads that have not started yet.
+        """
+        self._gauge_timer.Stop()
+        self._dl_executor.shutdown(wait=False, cancel_futures=cancel)
+
     # ================================================================== #
     # Settings persistence                                                 #
     # ================================================================== #
 
     def _save_current_page_state(self) -> None:
         """Save state from the current page's controls."""
-        if self._current_page == PAGE_MODE:
-            # Save experience mode
-            if hasattr(self, "_mode_advanced") and self._mode_advanced.GetValue():
-                self._settings.general.experience_mode = "advanced"
-            else:
-                self._settings.general.experience_mode = "basic"
-
-        elif self._current_page == PAGE_PROVIDERS:
-            # Save API keys
-            if hasattr(self, "_provider_inputs"):
-                for key_id, txt in self._provider_inputs.items():
-                    value = txt.GetValue().strip()
-                    if value:
-                        self._key_store.store_key(key_id, value)
-                        self._provider_keys[key_id] = value
-
-        elif self._current_page == PAGE_AI_COPILOT:
-            # Save Gemini key
-            if hasattr(self, "_wizard_gemini_key"):
-                gemini_key = self._wizard_gemini_key.GetValue().strip()
-                if gemini_key:
-                    self._key_store.store_key("gemini", gemini_key)
-                    self._provider_keys["gemini"] = gemini_key
-            # Save OpenAI key for AI features
-            if hasattr(self, "_wizard_openai_key"):
-                openai_key = self._wizard_openai_key.GetValue().strip()
-                if openai_key:
-                    self._key_store.store_key("openai", openai_key)
-                    self._provider_keys["openai"] = openai_key
-            # Save Copilot setting
-            if hasattr(self, "_wizard_copilot_enable"):
-                self._settings.copilot.enabled = self._wizard_copilot_enable.GetValue()
-
-        elif self._current_page == PAGE_BUDGET:
-            if hasattr(self, "_wiz_budget_enabled"):
-                self._settings.budget.enabled = self._wiz_budget_enabled.GetValue()
-            if hasattr(self, "_wiz_always_confirm"):
-                self._settings.budget.always_confirm_paid = self._wiz_always_confirm.GetValue()
-            if hasattr(self, "_wiz_budget_limit"):
-                self._settings.budget.default_limit_usd = self._wiz_budget_limit.GetValue()
-
-        elif self._current_page == PAGE_PREFERENCES:
-            if hasattr(self, "_pref_language"):
-                lang_map = {
-                    0: "auto",
-                    1: "en",
-                    2: "es",
-                    3: "fr",
-                    4: "de",
-                    5: "it",
-                    6: "pt",
-                    7: "nl",
-                    8: "ru",
-                    9: "zh",
-                    10: "ja",
-                    11: "ko",
-                    12: "ar",
-                    13: "hi",
-                }
-                sel = self._pref_language.GetSelection()
-                self._settings.general.language = lang_map.get(sel, "auto")
-
-            if hasattr(self, "_pref_format"):
-                fmt_map = {0: "txt", 1: "md", 2: "docx", 3: "srt"}
-                sel = self._pref_format.GetSelection()
-                self._settings.output.default_format = fmt_map.get(sel, "txt")
-
-            if hasattr(self, "_pref_auto_export"):
-                self._settings.general.auto_export = self._pref_auto_export.GetValue()
-            if hasattr(self, "_pref_timestamps"):
-                self._settings.transcription.include_timestamps = self._pref_timestamps.GetValue()
-            if hasattr(self, "_pref_minimize"):
-                self._settings.general.minimize_to_tray = self._pref_minimize.GetValue()
-            if hasattr(self, "_pref_notifications"):
-                self._settings.general.show_notifications = self._pref_notifications.GetValue()
-            if hasattr(self, "_pref_updates"):
-                self._settings.general.check_updates_on_start = self._pref_updates.GetValue()
+        page = self._current_page
+        for spec in _PAGE_SAVERS.get(page, ()):
+            widget = getattr(self, spec.attr)
+            if widget is None:
+                continue  # page not built yet
+            value = getattr(widget, spec.getter)()
+            if spec.transform is not None:
+                value = spec.transform(value)
+            self._assign(spec.section, spec.field, value)
+
+        saver = self._page_savers.get(page)
+        if saver is not None:
+            saver()
+
+    def _save_provider_keys(self) -> None:
+        """Stage the API keys typed on the providers page."""
+        # Most fields are left empty, so skip those before stripping
+        entered: dict[str, str] = {}
+        for key_id, txt in self._provider_inputs.items():
+            raw = txt.GetValue()
+            if raw and (value := raw.strip()):
+                entered[key_id] = value
+        self._stage_keys(entered)
+
+    def _save_ai_keys(self) -> None:
+        """Stage the Gemini and OpenAI keys typed on the AI page."""
+        keys: dict[str, str] = {}
+        for key_id, attr in _AI_KEY_FIELDS:
+            value = self._read_text(attr)
+            if value:
+                keys[key_id] = value
+        self._stage_keys(keys)
+
+    def _assign(self, section: str, field: str, value: object) -> None:
+        """Set a settings field, marking the wizard dirty if it changed.
+
+        Args:
+            section: Settings section, e.g. ``"general"``.
+            field: Field within the section.
+            value: New value.
+        """
+        target = getattr(self._settings, section)
+        if getattr(target, field) != value:
+            setattr(target, field, value)
+            self._dirty = True
+
+    def _read_text(self, attr: str) -> str | None:
+        """Read a text control once and return its stripped value.
+
+        Args:
+            attr: Wizard attribute holding the text control.
+
+        Returns:
+            The stripped text, or None if the control is not built or is empty.
+        """
+        widget = getattr(self, attr)
+        if widget is None:
+            return None
+        raw = widget.GetValue()
+        return (raw.strip() or None) if raw else None
 
     def _apply_all_settings(self) -> None:
         """Apply and save all wizard settings."""
-        # Set recommended model as default if one was selected
-        if self._selected_models:
-            # Pick the best selected model as default
-            for m in reversed(WHISPER_MODELS):
-                if m.id in self._selected_models and self._model_manager.is_downloaded(m.id):
-                    self._settings.general.default_model = m.id
-                    break
+        self._commit_keys()
 
+        # Make the largest selected model that finished downloading the default
+        if self._selected_models:
+            downloaded = self._model_manager.downloaded_ids()
+            ready = [mid for mid in self._selected_models if mid in downloaded]
+            if ready:
+                self._assign("general", "default_model", max(ready, key=_MODEL_RANK.__getitem__))
+
+        # Nothing to write if every setting matches the settings file
+        if not self._dirty:
+            logger.info("Wizard settings unchanged; nothing to save")
+            return
         self._settings.save()
         logger.info("Wizard settings applied and saved")
 
@@ -19,14 +19,32 @@ matching for autocomplete and can resolve partial command names.
 
 from __future__ import annotations
 
+import io
 import logging
-import re
+import os
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
+
+# Lightweight core modules are bound once here; wx-dependent and heavy
+# modules (accessibility helpers, transcription service, Copilot SDK
+# wrapper, chat panel) stay imported inside the handlers that need them.
+from bits_whisperer.core.ai_service import _SUMMARIZE_STYLES, AIService
+from bits_whisperer.core.context_manager import (
+    count_tokens,
+    create_context_manager,
+    get_model_context_window,
+)
+from bits_whisperer.core.job import JobStatus
+from bits_whisperer.core.settings import AppSettings
+from bits_whisperer.utils.constants import DATA_DIR, EXPORT_FORMATS
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from bits_whisperer.core.context_manager import ContextWindowManager
     from bits_whisperer.ui.copilot_chat_panel import CopilotChatPanel
 
 logger = logging.getLogger(__name__)
@@ -37,7 +55,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlashCommand:
     """Definition of a single slash command.
 
@@ -57,27 +75,131 @@ class SlashCommand:
     description: str
     category: str
     handler: Callable[[CopilotChatPanel, str], None]
-    aliases: list[str] = field(default_factory=list)
+    aliases: tuple[str, ...] = ()
     arg_hint: str = ""
     requires_transcript: bool = False
 
 
+def _char_mask(text: str) -> int:
+    """Return a 64-bit mask with one bit set per character in *text*.
+
+    A name can only contain *text* as a substring if its mask covers every
+    bit of the mask of *text*.
+    """
+    mask = 0
+    for ch in text:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+_MATCH_CACHE_SIZE = 64  # prefixes remembered by SlashCommandRegistry.match
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    """One character step in the command-name prefix trie.
+
+    Attributes:
+        children: Next nodes keyed by character.
+        terminals: ``(kind, order, command_name)`` for every name (kind 0)
+            or alias (kind 1) that ends at this node; *order* is the
+            command's registration position.
+    """
+
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    terminals: list[tuple[int, int, str]] = field(default_factory=list)
+
+    def clone(self) -> _TrieNode:
+        """Return an independent copy of this node and everything below it."""
+        return _TrieNode(
+            {ch: child.clone() for ch, child in self.children.items()},
+            list(self.terminals),
+        )
+
+
 class SlashCommandRegistry:
     """Registry of available slash commands with matching support."""
 
     def __init__(self) -> None:
         self._commands: dict[str, SlashCommand] = {}
+        self._commands_view = MappingProxyType(self._commands)
         self._alias_map: dict[str, str] = {}
+        self._order: dict[str, int] = {}  # registration position per command
+        self._trie = _TrieNode()
+        self._trie_shared = False  # set by copy(); cloned before the next insert
+        self._by_category: dict[str, list[SlashCommand]] | None = None
+        self._sorted: tuple[SlashCommand, ...] | None = None
+        self._help_text: str | None = None
+        self._name_masks: dict[str, int] = {}  # _char_mask of each command name
+        self._match_cache: dict[str, tuple[SlashCommand, ...]] = {}
 
     def register(self, command: SlashCommand) -> None:
         """Register a slash command.
 
+        Names and aliases must be lowercase: input is lowercased once by
+        :func:`parse_slash_command` and :meth:`match`, and lookups then
+        compare the strings as stored.
+
         Args:
             command: The command definition.
+
+        Raises:
+            ValueError: If the name or an alias contains uppercase letters.
         """
+        for key in (command.name, *command.aliases):
+            if key != key.lower():
+                raise ValueError(f"Slash command names must be lowercase: {key!r}")
         self._commands[command.name] = command
+        self._name_masks[command.name] = _char_mask(command.name)
+        self._by_category = None
+        self._sorted = None
+        self._help_text = None
+        self._match_cache.clear()
+        if self._trie_shared:
+            self._trie = self._trie.clone()
+            self._trie_shared = False
+        order = self._order.setdefault(command.name, len(self._order))
+        self._trie_insert(command.name, (0, order, command.name))
         for alias in command.aliases:
             self._alias_map[alias] = command.name
+            self._trie_insert(alias, (1, order, command.name))
+
+    def copy(self) -> SlashCommandRegistry:
+        """Return a registry with the same commands that can be extended independently.
+
+        The command objects are frozen and shared.  The prefix trie is shared
+        too until either registry registers another command.
+        """
+        other = SlashCommandRegistry()
+        other._commands = dict(self._commands)
+        other._commands_view = MappingProxyType(other._commands)
+        other._alias_map = dict(self._alias_map)
+        other._order = dict(self._order)
+        other._name_masks = dict(self._name_masks)
+        other._trie = self._trie
+        other._trie_shared = self._trie_shared = True
+        other._sorted = self._sorted
+        other._help_text = self._help_text
+        return other
+
+    def _trie_insert(self, key: str, terminal: tuple[int, int, str]) -> None:
+        """Add *key* to the prefix trie, ending in *terminal*."""
+        node = self._trie
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            node = child
+        node.terminals.append(terminal)
+
+    @property
+    def commands(self) -> MappingProxyType[str, SlashCommand]:
+        """Read-only live view of registered commands keyed by name.
+
+        The view tracks later registrations, so callers can keep it and
+        iterate it without copying.
+        """
+        return self._commands_view
 
     def get(self, name: str) -> SlashCommand | None:
         """Look up a command by name or alias.
@@ -91,12 +213,16 @@ class SlashCommandRegistry:
         canonical = self._alias_map.get(name, name)
         return self._commands.get(canonical)
 
-    def all_commands(self) -> list[SlashCommand]:
-        """Return all registered commands sorted by category then name."""
-        return sorted(
-            self._commands.values(),
-            key=lambda c: (c.category, c.name),
-        )
+    def all_commands(self) -> tuple[SlashCommand, ...]:
+        """Return all registered commands sorted by category then name.
+
+        The sorted tuple is reused until another command is registered.
+        """
+        if self._sorted is None:
+            self._sorted = tuple(
+                sorted(self._commands.values(), key=lambda c: (c.category, c.name))
+            )
+        return self._sorted
 
     def match(self, prefix: str) -> list[SlashCommand]:
         """Return commands whose name or alias starts with *prefix*.
@@ -104,38 +230,106 @@ class SlashCommandRegistry:
         Args:
             prefix: Partial command name (without ``/``).
 
+        Results for the last :data:`_MATCH_CACHE_SIZE` prefixes are kept
+        until another command is registered, since autocomplete re-queries
+        the same short prefixes as the user types and deletes.
+
         Returns:
             Matching commands, sorted by relevance.
         """
         prefix_lower = prefix.lower()
+        cached = self._match_cache.get(prefix_lower)
+        if cached is not None:
+            return list(cached)
         results: list[SlashCommand] = []
         seen: set[str] = set()
 
-        # Exact name prefix matches first
-        for cmd in self._commands.values():
-            if cmd.name.startswith(prefix_lower) and cmd.name not in seen:
-                results.append(cmd)
-                seen.add(cmd.name)
-
-        # Alias prefix matches
-        for alias, canonical in self._alias_map.items():
-            if alias.startswith(prefix_lower) and canonical not in seen:
+        # Walk the trie down to the prefix, then collect everything below it
+        hits: list[tuple[int, int, str]] = []
+        node = self._trie
+        for ch in prefix_lower:
+            child = node.children.get(ch)
+            if child is None:
+                break  # no name or alias starts with the prefix
+            node = child
+        else:
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                hits.extend(current.terminals)
+                stack.extend(current.children.values())
+
+        # Name prefix matches first, then alias prefix matches, each in
+        # registration order
+        hits.sort()
+        for _kind, _order, canonical in hits:
+            if canonical not in seen:
                 cmd = self._commands.get(canonical)
                 if cmd:
                     results.append(cmd)
                     seen.add(canonical)
 
-        # Fuzzy: substring matches (lower priority)
-        for cmd in self._commands.values():
-            if cmd.name not in seen and prefix_lower in cmd.name:
+        # Fuzzy: substring matches (lower priority).  The character masks
+        # rule out most names without a substring search.
+        query_mask = _char_mask(prefix_lower)
+        masks = self._name_masks
+        for name, cmd in self._commands.items():
+            if masks[name] & query_mask != query_mask or name in seen:
+                continue
+            if prefix_lower in name:
                 results.append(cmd)
-                seen.add(cmd.name)
+                seen.add(name)
 
+        cache = self._match_cache
+        if len(cache) >= _MATCH_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[prefix_lower] = tuple(results)
         return results
 
     def categories(self) -> list[str]:
         """Return sorted unique category names."""
-        return sorted({c.category for c in self._commands.values()})
+        return list(self.grouped())
+
+    def grouped(self) -> dict[str, list[SlashCommand]]:
+        """Return commands grouped by category.
+
+        The grouping is built on first use and reused until another command
+        is registered.
+
+        Returns:
+            Category name to commands, both sorted by name.
+        """
+        if self._by_category is None:
+            groups: dict[str, list[SlashCommand]] = {}
+            for cmd in self._commands.values():
+                groups.setdefault(cmd.category, []).append(cmd)
+            self._by_category = {
+                category: sorted(groups[category], key=lambda c: c.name)
+                for category in sorted(groups)
+            }
+        return self._by_category
+
+    def help_text(self) -> str:
+        """Return the ``/help`` listing of all commands by category.
+
+        The text is rendered on first use and reused until another command
+        is registered.
+        """
+        if self._help_text is None:
+            out = io.StringIO()
+            out.write("Available Slash Commands\n" + "\u2501" * 36 + "\n\n")
+            for category, cmds in self.grouped().items():
+                out.write(f"\u2550\u2550 {category} \u2550" * 3 + "\n")
+                for cmd in cmds:
+                    arg_part = f" {cmd.arg_hint}" if cmd.arg_hint else ""
+                    alias_part = ""
+                    if cmd.aliases:
+                        alias_part = f"  (aliases: {', '.join('/' + a for a in cmd.aliases)})"
+                    out.write(f"  /{cmd.name}{arg_part}\n    {cmd.description}{alias_part}\n")
+                out.write("\n")
+            out.write("Tip: Type / and start typing to see suggestions.")
+            self._help_text = out.getvalue()
+        return self._help_text
 
 
 # ---------------------------------------------------------------------------
@@ -156,11 +350,89 @@ def parse_slash_command(text: str) -> tuple[str, str] | None:
     text = text.strip()
     if not text.startswith("/"):
         return None
-    # Split on first whitespace
-    match = re.match(r"/(\S+)\s*(.*)", text, re.DOTALL)
-    if not match:
+    rest = text[1:]
+    # The name must follow the slash directly
+    if not rest or rest[0].isspace():
         return None
-    return match.group(1).lower(), match.group(2).strip()
+    # Split on first whitespace
+    parts = rest.split(None, 1)
+    args = parts[1].strip() if len(parts) > 1 else ""
+    return parts[0].lower(), args
+
+
+# ---------------------------------------------------------------------------
+# AI action template index
+# ---------------------------------------------------------------------------
+
+# Saved templates by lowercase name, with the agents directory mtime it was read at
+_agents_cache: tuple[int, dict[str, Path]] | None = None
+
+
+def _load_agents() -> dict[str, Path]:
+    """Return saved AI action templates keyed by lowercase file stem.
+
+    The agents directory is listed again only when its modification time
+    changes, i.e. when a template is added, removed or renamed.
+
+    Returns:
+        Mapping of lowercase template name to its JSON file.
+    """
+    global _agents_cache
+    agents_dir = DATA_DIR / "agents"
+    try:
+        mtime = agents_dir.stat().st_mtime_ns
+        if _agents_cache is None or _agents_cache[0] != mtime:
+            agents: dict[str, Path] = {}
+            with os.scandir(agents_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        path = Path(entry.path)
+                        agents[path.stem.lower()] = path
+            _agents_cache = (mtime, agents)
+    except OSError:
+        return {}
+    return _agents_cache[1]
+
+
+# Built-in presets by lowercase name, as (display name, instructions); filled on first use
+_preset_index_cache: dict[str, tuple[str, str]] | None = None
+
+
+def _preset_index() -> dict[str, tuple[str, str]]:
+    """Return the built-in AI action presets keyed by lowercase name."""
+    global _preset_index_cache
+    if _preset_index_cache is None:
+        from bits_whisperer.core.transcription_service import TranscriptionService
+
+        _preset_index_cache = {
+            name.lower(): (name, text)
+            for name, text in TranscriptionService._BUILTIN_PRESETS.items()
+        }
+    return _preset_index_cache
+
+
+def _find_template(
+    name: str,
+) -> tuple[Literal["preset"], tuple[str, str]] | tuple[Literal["file"], Path] | None:
+    """Resolve a template name, ignoring case, to a built-in preset or saved file.
+
+    Built-in presets win over saved templates with the same name.
+
+    Args:
+        name: Template name typed after ``/run``.
+
+    Returns:
+        ``("preset", (display_name, instructions))``, ``("file", path)``,
+        or None if nothing matches.
+    """
+    key = name.lower()
+    preset = _preset_index().get(key)
+    if preset is not None:
+        return "preset", preset
+    path = _load_agents().get(key)
+    if path is not None:
+        return "file", path
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -170,23 +442,7 @@ def parse_slash_command(text: str) -> tuple[str, str] | None:
 
 def _cmd_help(panel: CopilotChatPanel, args: str) -> None:
     """Show all available slash commands."""
-    registry = panel._slash_registry
-    lines = ["Available Slash Commands", "\u2501" * 36, ""]
-
-    for category in registry.categories():
-        lines.append(f"\u2550\u2550 {category} \u2550" * 3)
-        cmds = [c for c in registry.all_commands() if c.category == category]
-        for cmd in cmds:
-            arg_part = f" {cmd.arg_hint}" if cmd.arg_hint else ""
-            alias_part = ""
-            if cmd.aliases:
-                alias_part = f"  (aliases: {', '.join('/' + a for a in cmd.aliases)})"
-            lines.append(f"  /{cmd.name}{arg_part}")
-            lines.append(f"    {cmd.description}{alias_part}")
-        lines.append("")
-
-    lines.append("Tip: Type / and start typing to see suggestions.")
-    panel._append_message("System", "\n".join(lines))
+    panel._append_message("System", panel._slash_registry.help_text())
 
 
 def _cmd_clear(panel: CopilotChatPanel, args: str) -> None:
@@ -196,7 +452,7 @@ def _cmd_clear(panel: CopilotChatPanel, args: str) -> None:
 
 def _cmd_summarize(panel: CopilotChatPanel, args: str) -> None:
     """Summarize the transcript with an optional style argument."""
-    style = args.strip().lower() if args.strip() else ""
+    style = args.strip().lower()
     valid_styles = {"concise", "detailed", "bullets", "bullet_points"}
 
     if style and style not in valid_styles:
@@ -213,15 +469,9 @@ def _cmd_summarize(panel: CopilotChatPanel, args: str) -> None:
         style = "bullet_points"
 
     if style:
-        from bits_whisperer.core.ai_service import _SUMMARIZE_STYLES
-
         template = _SUMMARIZE_STYLES.get(style)
         if template and panel._transcript_context:
-            from bits_whisperer.core.context_manager import create_context_manager
-            from bits_whisperer.core.settings import AppSettings
-
-            settings = AppSettings.load()
-            ctx_mgr = create_context_manager(settings.ai)
+            settings, _ai_svc, ctx_mgr = _ai_services(panel)
             prepared = ctx_mgr.prepare_action_context(
                 model=getattr(settings.ai, f"{settings.ai.selected_provider}_model", ""),
                 provider=settings.ai.selected_provider,
@@ -249,13 +499,11 @@ def _cmd_summarize(panel: CopilotChatPanel, args: str) -> None:
 
 def _cmd_translate(panel: CopilotChatPanel, args: str) -> None:
     """Translate the transcript to a target language."""
-    language = args.strip() if args.strip() else ""
+    language = args.strip()
 
     if not language:
         # Use the configured default
-        from bits_whisperer.core.settings import AppSettings
-
-        settings = AppSettings.load()
+        settings = AppSettings.cached()
         language = settings.ai.translation_target_language or "Spanish"
 
     prompt = (
@@ -327,9 +575,8 @@ def _cmd_ask(panel: CopilotChatPanel, args: str) -> None:
 def _cmd_export(panel: CopilotChatPanel, args: str) -> None:
     """Export the current transcript to a file."""
     from bits_whisperer.utils.accessibility import announce_status, safe_call_after
-    from bits_whisperer.utils.constants import EXPORT_FORMATS
 
-    fmt = args.strip().lower() if args.strip() else ""
+    fmt = args.strip().lower()
 
     if fmt and fmt not in EXPORT_FORMATS:
         valid = ", ".join(EXPORT_FORMATS.keys())
@@ -354,11 +601,7 @@ def _cmd_export(panel: CopilotChatPanel, args: str) -> None:
 
         exporter = get_exporter(fmt)
         if exporter:
-            from pathlib import Path
-
-            from bits_whisperer.core.settings import AppSettings
-
-            settings = AppSettings.load()
+            settings = AppSettings.cached()
             stem = Path(mf.transcript_panel._current_job.file_path).stem
             out_dir = settings.output.output_directory
             out_path = str(Path(out_dir) / f"{stem}.{fmt}")
@@ -452,19 +695,17 @@ def _cmd_status(panel: CopilotChatPanel, args: str) -> None:
     """Show current queue and transcription status."""
     mf = panel._main_frame
     try:
-        pending = mf.queue_panel.get_pending_jobs()
-        total_jobs = len(mf.queue_panel._jobs)
-        pending_count = len(pending)
-        completed = sum(1 for j in mf.queue_panel._jobs.values() if j.status == "COMPLETED")
-        failed = sum(1 for j in mf.queue_panel._jobs.values() if j.status == "FAILED")
+        # One pass over the queue for every status count
+        jobs = mf.queue_panel._jobs
+        counts = Counter(j.status for j in jobs.values())
+        total_jobs = len(jobs)
+        pending_count = counts[JobStatus.PENDING]
+        completed = counts[JobStatus.COMPLETED]
+        failed = counts[JobStatus.FAILED]
         active = total_jobs - pending_count - completed - failed
 
         # Provider info
-        from bits_whisperer.core.ai_service import AIService
-        from bits_whisperer.core.settings import AppSettings
-
-        settings = AppSettings.load()
-        ai_svc = AIService(mf.key_store, settings.ai)
+        _settings, ai_svc, _ctx_mgr = _ai_services(panel)
         provider_display = ai_svc.get_provider_display_name()
         has_transcript = bool(panel._transcript_context)
 
@@ -487,7 +728,7 @@ def _cmd_status(panel: CopilotChatPanel, args: str) -> None:
 
 def _cmd_provider(panel: CopilotChatPanel, args: str) -> None:
     """Switch AI provider or show current one."""
-    target = args.strip().lower() if args.strip() else ""
+    target = args.strip().lower()
 
     if not target:
         # Show current
@@ -568,19 +809,10 @@ def _cmd_run(panel: CopilotChatPanel, args: str) -> None:
     template_name = args.strip()
     if not template_name:
         # List available templates
-        from bits_whisperer.core.transcription_service import TranscriptionService
-
-        presets = list(TranscriptionService._BUILTIN_PRESETS.keys())
+        presets = [display for display, _text in _preset_index().values()]
 
         # Check for saved templates
-
-        from bits_whisperer.utils.constants import DATA_DIR
-
-        agents_dir = DATA_DIR / "agents"
-        saved: list[str] = []
-        if agents_dir.is_dir():
-            for f in sorted(agents_dir.glob("*.json")):
-                saved.append(f.stem)
+        saved = sorted(path.stem for path in _load_agents().values())
 
         lines = [
             "Available AI Action Templates",
@@ -610,48 +842,32 @@ def _cmd_run(panel: CopilotChatPanel, args: str) -> None:
         )
         return
 
-    # Resolve template instructions
-    from bits_whisperer.core.transcription_service import TranscriptionService
-
-    # Check built-in presets (case-insensitive match)
-    preset_map = {k.lower(): k for k in TranscriptionService._BUILTIN_PRESETS}
-    resolved_name = preset_map.get(template_name.lower())
-
-    instructions = ""
-    if resolved_name:
-        instructions = TranscriptionService._BUILTIN_PRESETS[resolved_name]
+    # Resolve template instructions (built-in preset or saved template file)
+    source = _find_template(template_name)
+    if source is None:
+        panel._append_message(
+            "System",
+            f"Template '{template_name}' not found. Use /run to see available templates.",
+        )
+        return
+    if source[0] == "preset":
+        resolved_name, instructions = source[1]
     else:
-        # Try saved template file
+        try:
+            from bits_whisperer.core.copilot_service import AgentConfig
 
-        from bits_whisperer.utils.constants import DATA_DIR
-
-        template_path = DATA_DIR / "agents" / f"{template_name}.json"
-        if template_path.is_file():
-            try:
-                from bits_whisperer.core.copilot_service import AgentConfig
-
-                config = AgentConfig.load(template_path)
-                instructions = config.instructions
-                resolved_name = config.name or template_name
-            except Exception as exc:
-                panel._append_message(
-                    "System",
-                    f"Failed to load template '{template_name}': {exc}",
-                )
-                return
-        else:
+            config = AgentConfig.load(source[1])
+            instructions = config.instructions
+            resolved_name = config.name or template_name
+        except Exception as exc:
             panel._append_message(
                 "System",
-                f"Template '{template_name}' not found. Use /run to see available templates.",
+                f"Failed to load template '{template_name}': {exc}",
             )
             return
 
     # Build prompt with model-aware context fitting
-    from bits_whisperer.core.context_manager import create_context_manager
-    from bits_whisperer.core.settings import AppSettings
-
-    settings = AppSettings.load()
-    ctx_mgr = create_context_manager(settings.ai)
+    settings, _ai_svc, ctx_mgr = _ai_services(panel)
     prepared = ctx_mgr.prepare_action_context(
         model=getattr(settings.ai, f"{settings.ai.selected_provider}_model", ""),
         provider=settings.ai.selected_provider,
@@ -675,21 +891,32 @@ def _cmd_run(panel: CopilotChatPanel, args: str) -> None:
 
 def _cmd_copy(panel: CopilotChatPanel, args: str) -> None:
     """Copy the last AI response to the clipboard."""
-    # Find the last assistant message
-    for msg in reversed(panel._conversation_history):
-        if msg["role"] == "assistant":
-            panel._main_frame._copy_text(msg["content"])
-            panel._append_message("System", "Last response copied to clipboard.")
-            return
-    panel._append_message("System", "No AI response to copy.")
+    history = panel._conversation_history
+    idx = panel._last_assistant_idx
+    if 0 <= idx < len(history) and history[idx]["role"] == "assistant":
+        msg: dict[str, str] | None = history[idx]
+    else:
+        # Index is stale; find the last assistant message
+        msg = next((m for m in reversed(history) if m["role"] == "assistant"), None)
+    if msg is None:
+        panel._append_message("System", "No AI response to copy.")
+        return
+    panel._main_frame._copy_text(msg["content"])
+    panel._append_message("System", "Last response copied to clipboard.")
 
 
 def _cmd_history(panel: CopilotChatPanel, args: str) -> None:
     """Show conversation statistics."""
-    total = len(panel._conversation_history)
-    user_msgs = sum(1 for m in panel._conversation_history if m["role"] == "user")
-    asst_msgs = sum(1 for m in panel._conversation_history if m["role"] == "assistant")
-    total_chars = sum(len(m["content"]) for m in panel._conversation_history)
+    history = panel._conversation_history
+    total = len(history)
+    user_msgs = asst_msgs = total_chars = 0
+    for m in history:
+        total_chars += len(m["content"])
+        role = m["role"]
+        if role == "user":
+            user_msgs += 1
+        elif role == "assistant":
+            asst_msgs += 1
 
     lines = [
         "Conversation History",
@@ -724,22 +951,65 @@ def _cmd_agent(panel: CopilotChatPanel, args: str) -> None:
     panel._append_message("System", "Opening AI Action Builder...")
 
 
+def _ai_services(panel: CopilotChatPanel) -> tuple[AppSettings, AIService, ContextWindowManager]:
+    """Return the settings, AI service and context manager for AI commands.
+
+    The service and context manager are kept on the panel and rebuilt only
+    when :meth:`AppSettings.cached` hands back a new settings object (the
+    file changed on disk) or the key store is replaced.
+
+    Args:
+        panel: The chat panel.
+
+    Returns:
+        ``(settings, ai_service, context_manager)``.
+    """
+    settings = AppSettings.cached()
+    key_store = panel._main_frame.key_store
+    services = panel._slash_services
+    if services is None or services[0] is not settings or services[1] is not key_store:
+        services = (
+            settings,
+            key_store,
+            AIService(key_store, settings.ai),
+            create_context_manager(settings.ai),
+        )
+        panel._slash_services = services
+    return settings, services[2], services[3]
+
+
+def _history_tokens(panel: CopilotChatPanel, model: str, provider: str) -> int:
+    """Return the token count of the chat history, counting only new messages.
+
+    Counts are kept per message on the panel and reused while the history
+    only grows; they are recounted after the history is cleared or the
+    model changes.
+
+    Args:
+        panel: The chat panel.
+        model: Model identifier used for counting.
+        provider: Provider identifier used for counting.
+
+    Returns:
+        Total tokens across all history messages.
+    """
+    history = panel._conversation_history
+    key, counts = panel._history_token_cache
+    n = len(counts)
+    if key != (model, provider) or n > len(history) or (n and counts[-1][0] is not history[n - 1]):
+        counts = []
+    for msg in history[len(counts) :]:
+        counts.append((msg, count_tokens(msg.get("content", ""), model=model, provider=provider)))
+    panel._history_token_cache = ((model, provider), counts)
+    return sum(tokens for _msg, tokens in counts)
+
+
 def _cmd_context(panel: CopilotChatPanel, args: str) -> None:
     """Show context window budget and transcript fit information."""
-    from bits_whisperer.core.ai_service import AIService
-    from bits_whisperer.core.context_manager import (
-        count_tokens,
-        create_context_manager,
-        get_model_context_window,
-    )
-    from bits_whisperer.core.settings import AppSettings
-
-    settings = AppSettings.load()
-    ai_svc = AIService(panel._main_frame.key_store, settings.ai)
+    settings, ai_svc, ctx_mgr = _ai_services(panel)
     model_id = ai_svc._get_model_id()
     provider_id = settings.ai.selected_provider
 
-    ctx_mgr = create_context_manager(settings.ai)
     context_window = get_model_context_window(model_id, provider_id)
 
     def _fmt(n: int) -> str:
@@ -789,11 +1059,7 @@ def _cmd_context(panel: CopilotChatPanel, args: str) -> None:
         lines.append("")
         lines.append("No transcript loaded.")
 
-    history_tokens = count_tokens(
-        " ".join(m.get("content", "") for m in panel._conversation_history),
-        model=model_id,
-        provider=provider_id,
-    )
+    history_tokens = _history_tokens(panel, model_id, provider_id)
     lines.append("")
     lines.append(
         f"Chat History: {len(panel._conversation_history)} messages ({_fmt(history_tokens)} tokens)"
@@ -807,269 +1073,231 @@ def _cmd_context(panel: CopilotChatPanel, args: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Built-in commands, registered in this order
+_BUILTIN_COMMANDS: tuple[SlashCommand, ...] = (
+    # -- AI commands --
+    SlashCommand(
+        name="summarize",
+        description="Summarize the transcript (styles: concise, detailed, bullets)",
+        category="AI",
+        handler=_cmd_summarize,
+        aliases=("sum", "summary"),
+        arg_hint="[style]",
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="translate",
+        description="Translate the transcript to a target language",
+        category="AI",
+        handler=_cmd_translate,
+        aliases=("trans", "tr"),
+        arg_hint="[language]",
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="key-points",
+        description="Extract key points and takeaways",
+        category="AI",
+        handler=_cmd_key_points,
+        aliases=("kp", "keypoints"),
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="action-items",
+        description="Extract action items, tasks, and follow-ups",
+        category="AI",
+        handler=_cmd_action_items,
+        aliases=("ai", "actions", "todos"),
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="topics",
+        description="Identify the main topics discussed",
+        category="AI",
+        handler=_cmd_topics,
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="speakers",
+        description="Identify and describe each speaker",
+        category="AI",
+        handler=_cmd_speakers,
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="search",
+        description="Search the transcript for specific content",
+        category="AI",
+        handler=_cmd_search,
+        arg_hint="<query>",
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="ask",
+        description="Ask a freeform question about the transcript",
+        category="AI",
+        handler=_cmd_ask,
+        arg_hint="<question>",
+    ),
+    SlashCommand(
+        name="run",
+        description="Run an AI action template on the transcript",
+        category="AI",
+        handler=_cmd_run,
+        arg_hint="[template name]",
+    ),
+    SlashCommand(
+        name="copy",
+        description="Copy the last AI response to the clipboard",
+        category="AI",
+        handler=_cmd_copy,
+    ),
+    # -- App commands --
+    SlashCommand(
+        name="help",
+        description="Show all available slash commands",
+        category="App",
+        handler=_cmd_help,
+        aliases=("?", "commands"),
+    ),
+    SlashCommand(
+        name="clear",
+        description="Clear the conversation history",
+        category="App",
+        handler=_cmd_clear,
+    ),
+    SlashCommand(
+        name="status",
+        description="Show queue status and current provider info",
+        category="App",
+        handler=_cmd_status,
+    ),
+    SlashCommand(
+        name="provider",
+        description="Switch AI provider or show current one",
+        category="App",
+        handler=_cmd_provider,
+        arg_hint="[provider_id]",
+    ),
+    SlashCommand(
+        name="export",
+        description="Export the transcript (formats: txt, md, html, docx, srt, vtt, json)",
+        category="App",
+        handler=_cmd_export,
+        arg_hint="[format]",
+        requires_transcript=True,
+    ),
+    SlashCommand(
+        name="open",
+        description="Open file picker to add audio files",
+        category="App",
+        handler=_cmd_open,
+        aliases=("add",),
+    ),
+    SlashCommand(
+        name="open-folder",
+        description="Open folder picker to add a folder of audio files",
+        category="App",
+        handler=_cmd_open_folder,
+        aliases=("folder", "add-folder"),
+    ),
+    SlashCommand(
+        name="start",
+        description="Start transcription of pending jobs",
+        category="App",
+        handler=_cmd_start,
+        aliases=("go", "transcribe"),
+    ),
+    SlashCommand(
+        name="pause",
+        description="Pause or resume transcription",
+        category="App",
+        handler=_cmd_pause,
+        aliases=("resume",),
+    ),
+    SlashCommand(
+        name="cancel",
+        description="Cancel the current transcription job",
+        category="App",
+        handler=_cmd_cancel,
+        aliases=("stop",),
+    ),
+    SlashCommand(
+        name="clear-queue",
+        description="Remove all jobs from the queue",
+        category="App",
+        handler=_cmd_clear_queue,
+    ),
+    SlashCommand(
+        name="retry",
+        description="Retry all failed jobs in the queue",
+        category="App",
+        handler=_cmd_retry,
+    ),
+    SlashCommand(
+        name="settings",
+        description="Open the AI provider settings dialog",
+        category="App",
+        handler=_cmd_settings,
+        aliases=("config", "prefs"),
+    ),
+    SlashCommand(
+        name="live",
+        description="Open live microphone transcription",
+        category="App",
+        handler=_cmd_live,
+        aliases=("mic", "microphone"),
+    ),
+    SlashCommand(
+        name="models",
+        description="Open the Whisper model manager",
+        category="App",
+        handler=_cmd_models,
+    ),
+    SlashCommand(
+        name="agent",
+        description="Open the AI Action Builder to create/edit templates",
+        category="App",
+        handler=_cmd_agent,
+        aliases=("builder", "action-builder"),
+    ),
+    SlashCommand(
+        name="history",
+        description="Show conversation statistics",
+        category="App",
+        handler=_cmd_history,
+    ),
+    SlashCommand(
+        name="context",
+        description="Show context window budget and transcript fit info",
+        category="App",
+        handler=_cmd_context,
+        aliases=("ctx", "budget"),
+    ),
+)
+
+_default_registry: SlashCommandRegistry | None = None
+
+
 def build_default_registry() -> SlashCommandRegistry:
-    """Create and populate the default slash command registry.
+    """Return a registry populated with all built-in commands.
+
+    The built-in table is constructed once per process; each call returns
+    an independent :meth:`SlashCommandRegistry.copy` of it, so callers may
+    register extra commands without affecting other panels.
 
     Returns:
         A fully-populated SlashCommandRegistry with all built-in commands.
     """
-    reg = SlashCommandRegistry()
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = _build_default_registry()
+    return _default_registry.copy()
 
-    # -- AI commands --
-    reg.register(
-        SlashCommand(
-            name="summarize",
-            description="Summarize the transcript (styles: concise, detailed, bullets)",
-            category="AI",
-            handler=_cmd_summarize,
-            aliases=["sum", "summary"],
-            arg_hint="[style]",
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="translate",
-            description="Translate the transcript to a target language",
-            category="AI",
-            handler=_cmd_translate,
-            aliases=["trans", "tr"],
-            arg_hint="[language]",
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="key-points",
-            description="Extract key points and takeaways",
-            category="AI",
-            handler=_cmd_key_points,
-            aliases=["kp", "keypoints"],
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="action-items",
-            description="Extract action items, tasks, and follow-ups",
-            category="AI",
-            handler=_cmd_action_items,
-            aliases=["ai", "actions", "todos"],
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="topics",
-            description="Identify the main topics discussed",
-            category="AI",
-            handler=_cmd_topics,
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="speakers",
-            description="Identify and describe each speaker",
-            category="AI",
-            handler=_cmd_speakers,
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="search",
-            description="Search the transcript for specific content",
-            category="AI",
-            handler=_cmd_search,
-            arg_hint="<query>",
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="ask",
-            description="Ask a freeform question about the transcript",
-            category="AI",
-            handler=_cmd_ask,
-            arg_hint="<question>",
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="run",
-            description="Run an AI action template on the transcript",
-            category="AI",
-            handler=_cmd_run,
-            arg_hint="[template name]",
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="copy",
-            description="Copy the last AI response to the clipboard",
-            category="AI",
-            handler=_cmd_copy,
-        )
-    )
-
-    # -- App commands --
-    reg.register(
-        SlashCommand(
-            name="help",
-            description="Show all available slash commands",
-            category="App",
-            handler=_cmd_help,
-            aliases=["?", "commands"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="clear",
-            description="Clear the conversation history",
-            category="App",
-            handler=_cmd_clear,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="status",
-            description="Show queue status and current provider info",
-            category="App",
-            handler=_cmd_status,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="provider",
-            description="Switch AI provider or show current one",
-            category="App",
-            handler=_cmd_provider,
-            arg_hint="[provider_id]",
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="export",
-            description="Export the transcript (formats: txt, md, html, docx, srt, vtt, json)",
-            category="App",
-            handler=_cmd_export,
-            arg_hint="[format]",
-            requires_transcript=True,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="open",
-            description="Open file picker to add audio files",
-            category="App",
-            handler=_cmd_open,
-            aliases=["add"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="open-folder",
-            description="Open folder picker to add a folder of audio files",
-            category="App",
-            handler=_cmd_open_folder,
-            aliases=["folder", "add-folder"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="start",
-            description="Start transcription of pending jobs",
-            category="App",
-            handler=_cmd_start,
-            aliases=["go", "transcribe"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="pause",
-            description="Pause or resume transcription",
-            category="App",
-            handler=_cmd_pause,
-            aliases=["resume"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="cancel",
-            description="Cancel the current transcription job",
-            category="App",
-            handler=_cmd_cancel,
-            aliases=["stop"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="clear-queue",
-            description="Remove all jobs from the queue",
-            category="App",
-            handler=_cmd_clear_queue,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="retry",
-            description="Retry all failed jobs in the queue",
-            category="App",
-            handler=_cmd_retry,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="settings",
-            description="Open the AI provider settings dialog",
-            category="App",
-            handler=_cmd_settings,
-            aliases=["config", "prefs"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="live",
-            description="Open live microphone transcription",
-            category="App",
-            handler=_cmd_live,
-            aliases=["mic", "microphone"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="models",
-            description="Open the Whisper model manager",
-            category="App",
-            handler=_cmd_models,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="agent",
-            description="Open the AI Action Builder to create/edit templates",
-            category="App",
-            handler=_cmd_agent,
-            aliases=["builder", "action-builder"],
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="history",
-            description="Show conversation statistics",
-            category="App",
-            handler=_cmd_history,
-        )
-    )
-    reg.register(
-        SlashCommand(
-            name="context",
-            description="Show context window budget and transcript fit info",
-            category="App",
-            handler=_cmd_context,
-            aliases=["ctx", "budget"],
-        )
-    )
 
+def _build_default_registry() -> SlashCommandRegistry:
+    """Create and populate the built-in slash command registry."""
+    reg = SlashCommandRegistry()
+    for command in _BUILTIN_COMMANDS:
+        reg.register(command)
     return reg
@@ -6,13 +6,14 @@ orchestration.
 """
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from bits_whisperer.core.context_manager import (
     ContextBudget,
     ContextWindowManager,
     ContextWindowSettings,
     PreparedContext,
+    _bpe_counts,
     chars_for_tokens,
     count_tokens,
     create_context_manager,
@@ -72,6 +73,37 @@ class TestEstimateTokensPrecise(unittest.TestCase):
         # This either returns an int (if tiktoken guesses) or None
         assert result is None or isinstance(result, int)
 
+    def test_repeat_counts_reuse_encoding(self) -> None:
+        fake = MagicMock()
+        fake.encoding_for_model.return_value.encode.return_value = [1, 2, 3]
+        _bpe_counts.clear()
+        try:
+            with patch.dict("sys.modules", {"tiktoken": fake}):
+                text = "a long transcript " * 10
+                assert estimate_tokens_precise(text, "gpt-4o") == 3
+                # An equal but separately built string hits the same entry
+                assert estimate_tokens_precise("".join(text), "gpt-4o") == 3
+                assert estimate_tokens_precise(text, "gpt-4o-mini") == 3
+            # Only digests and counts are kept, not the text
+            assert all(isinstance(k[0], bytes) and len(k[0]) == 16 for k in _bpe_counts)
+        finally:
+            _bpe_counts.clear()
+        assert fake.encoding_for_model.return_value.encode.call_count == 2
+
+    def test_count_cache_is_bounded(self) -> None:
+        from bits_whisperer.core.context_manager import _BPE_CACHE_SIZE
+
+        fake = MagicMock()
+        fake.encoding_for_model.return_value.encode.return_value = [1]
+        _bpe_counts.clear()
+        try:
+            with patch.dict("sys.modules", {"tiktoken": fake}):
+                for i in range(_BPE_CACHE_SIZE + 5):
+                    estimate_tokens_precise(f"text {i}", "gpt-4o")
+            assert len(_bpe_counts) == _BPE_CACHE_SIZE
+        finally:
+            _bpe_counts.clear()
+
 
 class TestCountTokens(unittest.TestCase):
     """Test the unified count_tokens function."""
@@ -30,6 +30,13 @@ class TestFormatTimestamp:
         assert "." not in ts
         assert ts == "00:00:05,500"
 
+    def test_milliseconds_truncate(self) -> None:
+        assert format_timestamp(59.9999) == "00:00:59.999"
+        assert format_timestamp_srt(3599.9995) == "00:59:59,999"
+
+    def test_long_recording(self) -> None:
+        assert format_timestamp_srt(100 * 3600 + 0.25) == "100:00:00,250"
+
 
 def _make_result(
     segments: list[TranscriptSegment] | None = None,
@@ -425,3 +425,86 @@ class TestKeyStoreAIEntries:
         from bits_whisperer.storage.key_store import _KEY_NAMES
 
         assert len(_KEY_NAMES) == 22
+
+
+class TestKeyStoreBatch:
+    """KeyStore batch lookup and storage."""
+
+    def test_unavailable_returns_none_for_all(self) -> None:
+        from bits_whisperer.storage.key_store import KeyStore
+
+        ks = KeyStore()
+        ks._available = False
+        assert ks.get_keys(["openai", "groq"]) == {"openai": None, "groq": None}
+
+    def test_resolves_backend_once(self) -> None:
+        import sys
+
+        from bits_whisperer.storage.key_store import KeyStore
+
+        backend = MagicMock()
+        backend.get_password.side_effect = lambda _svc, kid: (
+            "sk-test" if kid == "api_key_openai" else None
+        )
+        fake_keyring = MagicMock()
+        fake_keyring.get_keyring.return_value = backend
+
+        ks = KeyStore()
+        ks._available = True
+        with patch.dict(sys.modules, {"keyring": fake_keyring}):
+            keys = ks.get_keys(["openai", "groq", "gemini"])
+
+        assert keys == {"openai": "sk-test", "groq": None, "gemini": None}
+        fake_keyring.get_keyring.assert_called_once()
+        assert backend.get_password.call_count == 3
+
+    def test_store_keys_batch(self) -> None:
+        import sys
+
+        from bits_whisperer.storage.key_store import KeyStore
+
+        backend = MagicMock()
+        fake_keyring = MagicMock()
+        fake_keyring.get_keyring.return_value = backend
+
+        ks = KeyStore()
+        ks._available = True
+        with patch.dict(sys.modules, {"keyring": fake_keyring}):
+            ks.store_keys_batch({"openai": "sk-a", "groq": "gsk-b"})
+
+        fake_keyring.get_keyring.assert_called_once()
+        backend.set_password.assert_any_call("BITS Whisperer", "api_key_openai", "sk-a")
+        backend.set_password.assert_any_call("BITS Whisperer", "api_key_groq", "gsk-b")
+
+
+# -----------------------------------------------------------------------
+# ModelManager downloaded-id cache tests
+# -----------------------------------------------------------------------
+
+
+class TestModelManagerDownloadedIds:
+    """ModelManager.downloaded_ids scan and invalidation."""
+
+    def test_scans_models_dir(self, tmp_path: Path) -> None:
+        from bits_whisperer.core.model_manager import ModelManager
+
+        snapshot = tmp_path / "models--Systran--faster-whisper-tiny" / "snapshots" / "abc"
+        snapshot.mkdir(parents=True)
+        (snapshot / "config.json").write_text("{}", encoding="utf-8")
+        # A partial download without model files is not counted
+        (tmp_path / "models--Systran--faster-whisper-base").mkdir()
+
+        mm = ModelManager(models_dir=tmp_path)
+        assert mm.downloaded_ids() == frozenset({"tiny"})
+
+    def test_delete_invalidates_cache(self, tmp_path: Path) -> None:
+        from bits_whisperer.core.model_manager import ModelManager
+
+        model_dir = tmp_path / "models--Systran--faster-whisper-tiny"
+        model_dir.mkdir()
+        (model_dir / "model.bin").write_bytes(b"")
+
+        mm = ModelManager(models_dir=tmp_path)
+        assert "tiny" in mm.downloaded_ids()
+        assert mm.delete_model("tiny")
+        assert "tiny" not in mm.downloaded_ids()
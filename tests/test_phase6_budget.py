@@ -273,6 +273,42 @@ class TestWizardPageConstants:
         assert pages == list(range(9))
 
 
+class TestWizardRerun:
+    """Re-running the wizard over an existing settings file."""
+
+    def test_choosing_default_mode_overrides_saved_advanced(self, tmp_path: Path) -> None:
+        from types import SimpleNamespace
+
+        from bits_whisperer.ui.setup_wizard import PAGE_MODE, SetupWizard
+
+        settings_file = tmp_path / "settings.json"
+        with patch("bits_whisperer.core.settings._SETTINGS_PATH", settings_file):
+            saved = AppSettings()
+            saved.general.experience_mode = "advanced"
+            saved.general.language = "fr"
+            saved.save()
+
+            # The wizard state __init__ sets up, minus the widgets
+            wizard = SimpleNamespace(
+                _settings=AppSettings.load(),
+                _dirty=False,
+                _current_page=PAGE_MODE,
+                _mode_advanced=SimpleNamespace(GetValue=lambda: False),
+                _page_savers={},
+                _selected_models=[],
+                _commit_keys=lambda: None,
+            )
+            wizard._assign = lambda *args: SetupWizard._assign(wizard, *args)
+
+            SetupWizard._save_current_page_state(wizard)
+            SetupWizard._apply_all_settings(wizard)
+
+            reloaded = AppSettings.load()
+        assert reloaded.general.experience_mode == "basic"
+        # Fields the wizard did not touch keep their saved values
+        assert reloaded.general.language == "fr"
+
+
 # -----------------------------------------------------------------------
 # Cost estimation helpers
 # -----------------------------------------------------------------------
@@ -147,6 +147,56 @@ class TestAppSettingsSerialization:
             assert loaded.general.language == "fr"
             assert loaded.transcription.temperature == 0.5
 
+    def test_save_replaces_file_atomically(self, tmp_path: Path) -> None:
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text('{"general": {"language": "de"}}', encoding="utf-8")
+        with patch("bits_whisperer.core.settings._SETTINGS_PATH", settings_file):
+            settings = AppSettings()
+            settings.general.language = "fr"
+            settings.save()
+
+        assert json.loads(settings_file.read_text("utf-8"))["general"]["language"] == "fr"
+        assert not (tmp_path / "settings.json.tmp").exists()
+
+    def test_unchanged_save_skips_write(self, tmp_path: Path) -> None:
+        settings_file = tmp_path / "settings.json"
+        with patch("bits_whisperer.core.settings._SETTINGS_PATH", settings_file):
+            settings = AppSettings()
+            settings.save()
+            with patch("bits_whisperer.core.settings.os.replace") as replace:
+                settings.save()
+                replace.assert_not_called()
+
+                settings.general.language = "es"
+                settings.save()
+                replace.assert_called_once()
+
+    def test_failed_save_keeps_previous_file(self, tmp_path: Path) -> None:
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text('{"general": {"language": "de"}}', encoding="utf-8")
+        with (
+            patch("bits_whisperer.core.settings._SETTINGS_PATH", settings_file),
+            patch("bits_whisperer.core.settings.os.fsync", side_effect=OSError("disk full")),
+        ):
+            AppSettings().save()
+
+        assert json.loads(settings_file.read_text("utf-8"))["general"]["language"] == "de"
+        assert not (tmp_path / "settings.json.tmp").exists()
+
+    def test_cached_reuses_instance_until_saved(self, tmp_path: Path) -> None:
+        settings_file = tmp_path / "settings.json"
+        with patch("bits_whisperer.core.settings._SETTINGS_PATH", settings_file):
+            first = AppSettings.cached()
+            assert AppSettings.cached() is first
+
+            updated = AppSettings()
+            updated.general.language = "ja"
+            updated.save()
+
+            reloaded = AppSettings.cached()
+            assert reloaded is not first
+            assert reloaded.general.language == "ja"
+
     def test_load_missing_file_returns_defaults(self, tmp_path: Path) -> None:
         missing = tmp_path / "nonexistent.json"
         with patch("bits_whisperer.core.settings._SETTINGS_PATH", missing):
@@ -10,11 +10,21 @@ Covers:
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from bits_whisperer.ui.slash_commands import (
+    _BUILTIN_COMMANDS,
     SlashCommand,
     SlashCommandRegistry,
+    _ai_services,
+    _find_template,
+    _history_tokens,
+    _load_agents,
     build_default_registry,
     parse_slash_command,
 )
@@ -112,7 +122,7 @@ class TestSlashCommandDataclass:
             category="Cat",
             handler=lambda p, a: None,
         )
-        assert cmd.aliases == []
+        assert cmd.aliases == ()
         assert cmd.arg_hint == ""
         assert cmd.requires_transcript is False
 
@@ -122,9 +132,9 @@ class TestSlashCommandDataclass:
             description="desc",
             category="Cat",
             handler=lambda p, a: None,
-            aliases=["t", "tst"],
+            aliases=("t", "tst"),
         )
-        assert cmd.aliases == ["t", "tst"]
+        assert cmd.aliases == ("t", "tst")
 
     def test_with_arg_hint(self) -> None:
         cmd = SlashCommand(
@@ -146,6 +156,19 @@ class TestSlashCommandDataclass:
         )
         assert cmd.requires_transcript is True
 
+    def test_frozen_and_hashable(self) -> None:
+        cmd = SlashCommand(
+            name="test",
+            description="desc",
+            category="Cat",
+            handler=lambda p, a: None,
+            aliases=("t",),
+        )
+        with pytest.raises(AttributeError):
+            cmd.name = "other"  # type: ignore[misc]
+        assert not hasattr(cmd, "__dict__")
+        assert cmd in {cmd}
+
 
 # -----------------------------------------------------------------------
 # SlashCommandRegistry
@@ -176,7 +199,7 @@ class TestSlashCommandRegistry:
 
     def test_get_by_alias(self) -> None:
         reg = SlashCommandRegistry()
-        cmd = self._make_cmd("summarize", aliases=["sum", "summary"])
+        cmd = self._make_cmd("summarize", aliases=("sum", "summary"))
         reg.register(cmd)
         assert reg.get("sum") is cmd
         assert reg.get("summary") is cmd
@@ -190,6 +213,13 @@ class TestSlashCommandRegistry:
         cmds = reg.all_commands()
         assert [c.name for c in cmds] == ["a-cmd", "m-cmd", "z-cmd"]
 
+    def test_all_commands_refreshes_after_register(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("b"))
+        assert reg.all_commands() is reg.all_commands()
+        reg.register(self._make_cmd("a"))
+        assert [c.name for c in reg.all_commands()] == ["a", "b"]
+
     def test_match_prefix(self) -> None:
         reg = SlashCommandRegistry()
         reg.register(self._make_cmd("start"))
@@ -210,7 +240,7 @@ class TestSlashCommandRegistry:
 
     def test_match_alias_prefix(self) -> None:
         reg = SlashCommandRegistry()
-        reg.register(self._make_cmd("summarize", aliases=["sum"]))
+        reg.register(self._make_cmd("summarize", aliases=("sum",)))
         matches = reg.match("sum")
         assert len(matches) == 1
         assert matches[0].name == "summarize"
@@ -224,11 +254,24 @@ class TestSlashCommandRegistry:
 
     def test_match_no_duplicates(self) -> None:
         reg = SlashCommandRegistry()
-        reg.register(self._make_cmd("summarize", aliases=["sum"]))
+        reg.register(self._make_cmd("summarize", aliases=("sum",)))
         # "sum" matches both the alias and the name substring
         matches = reg.match("sum")
         assert len(matches) == 1
 
+    def test_match_orders_names_before_aliases(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("transcribe"))
+        reg.register(self._make_cmd("translate", aliases=("tr",)))
+        reg.register(self._make_cmd("start", aliases=("trigger",)))
+        names = [c.name for c in reg.match("tr")]
+        assert names == ["transcribe", "translate", "start"]
+
+    def test_match_unknown_prefix(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("help"))
+        assert reg.match("xyz") == []
+
     def test_categories(self) -> None:
         reg = SlashCommandRegistry()
         reg.register(self._make_cmd("a", category="AI"))
@@ -236,6 +279,59 @@ class TestSlashCommandRegistry:
         reg.register(self._make_cmd("c", category="AI"))
         assert reg.categories() == ["AI", "App"]
 
+    def test_register_rejects_uppercase(self) -> None:
+        reg = SlashCommandRegistry()
+        with pytest.raises(ValueError):
+            reg.register(self._make_cmd("Help"))
+        with pytest.raises(ValueError):
+            reg.register(self._make_cmd("help", aliases=("H",)))
+        assert reg.get("help") is None
+
+    def test_grouped_refreshes_after_register(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("b", category="App"))
+        reg.register(self._make_cmd("a", category="App"))
+        assert [c.name for c in reg.grouped()["App"]] == ["a", "b"]
+        reg.register(self._make_cmd("c", category="AI"))
+        assert list(reg.grouped()) == ["AI", "App"]
+
+    def test_commands_view_is_read_only_and_live(self) -> None:
+        reg = SlashCommandRegistry()
+        view = reg.commands
+        reg.register(self._make_cmd("start"))
+        assert list(view) == ["start"]
+        with pytest.raises(TypeError):
+            view["stop"] = self._make_cmd("stop")  # type: ignore[index]
+        assert list(reg.copy().commands) == ["start"]
+
+    def test_help_text_refreshes_after_register(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("start"))
+        text = reg.help_text()
+        assert reg.help_text() is text
+        assert "/start" in text
+        reg.register(self._make_cmd("stop"))
+        assert "/stop" in reg.help_text()
+
+    def test_match_cache_refreshes_after_register(self) -> None:
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("start"))
+        first = reg.match("st")
+        first.clear()
+        assert [c.name for c in reg.match("st")] == ["start"]
+        reg.register(self._make_cmd("stop"))
+        assert [c.name for c in reg.match("st")] == ["start", "stop"]
+
+    def test_match_cache_is_bounded(self) -> None:
+        from bits_whisperer.ui.slash_commands import _MATCH_CACHE_SIZE
+
+        reg = SlashCommandRegistry()
+        reg.register(self._make_cmd("start"))
+        for i in range(_MATCH_CACHE_SIZE + 10):
+            reg.match(f"q{i}")
+        assert len(reg._match_cache) == _MATCH_CACHE_SIZE
+        assert "q0" not in reg._match_cache
+
 
 # -----------------------------------------------------------------------
 # build_default_registry
@@ -308,6 +404,27 @@ class TestBuildDefaultRegistry:
         assert "AI" in cats
         assert "App" in cats
 
+    def test_each_call_returns_independent_registry(self) -> None:
+        first = build_default_registry()
+        second = build_default_registry()
+        assert first is not second
+        assert first.get("summarize") is second.get("summarize")
+
+        first.register(
+            SlashCommand(
+                name="summon",
+                description="Extra",
+                category="Test",
+                handler=lambda p, a: None,
+                aliases=("sm",),
+            )
+        )
+        assert first.get("sm") is not None
+        assert [c.name for c in first.match("summ")] == ["summarize", "summon"]
+        assert second.get("summon") is None
+        assert [c.name for c in second.match("summ")] == ["summarize"]
+        assert build_default_registry().get("summon") is None
+
     def test_alias_resolution(self) -> None:
         reg = build_default_registry()
         assert reg.get("sum") is reg.get("summarize")
@@ -318,6 +435,11 @@ class TestBuildDefaultRegistry:
         assert reg.get("stop") is reg.get("cancel")
         assert reg.get("mic") is reg.get("live")
 
+    def test_builtin_names_and_aliases_are_unique(self) -> None:
+        keys = [k for c in _BUILTIN_COMMANDS for k in (c.name, *c.aliases)]
+        assert len(keys) == len(set(keys))
+        assert all(k == k.lower() for k in keys)
+
     def test_transcript_requiring_commands(self) -> None:
         """Commands that need a transcript have requires_transcript=True."""
         reg = build_default_registry()
@@ -363,6 +485,8 @@ class TestCommandHandlers:
             {"role": "user", "content": "hello"},
             {"role": "assistant", "content": "Hi! How can I help?"},
         ]
+        panel._last_assistant_idx = 1
+        panel._slash_services = None
         panel._slash_registry = build_default_registry()
         panel._get_selected_provider_id.return_value = "openai"
         panel._available_providers = [
@@ -502,6 +626,13 @@ class TestCommandHandlers:
         cmd.handler(panel, "")
         panel._main_frame._copy_text.assert_called_once_with("Hi! How can I help?")
 
+    def test_copy_stale_index_falls_back_to_scan(self) -> None:
+        panel = self._make_panel()
+        panel._last_assistant_idx = 0  # points at the user message
+        reg = build_default_registry()
+        reg.get("copy").handler(panel, "")
+        panel._main_frame._copy_text.assert_called_once_with("Hi! How can I help?")
+
     def test_copy_no_response(self) -> None:
         panel = self._make_panel()
         panel._conversation_history = []
@@ -770,3 +901,148 @@ class TestSlashCommandExecution:
         cmd = reg.get("?")
         assert cmd is not None
         assert cmd.name == "help"
+
+
+# -----------------------------------------------------------------------
+# AI action template index
+# -----------------------------------------------------------------------
+
+
+class TestLoadAgents:
+    """Test the cached listing of saved AI action templates."""
+
+    def test_missing_dir(self, tmp_path: Path) -> None:
+        with (
+            patch("bits_whisperer.ui.slash_commands.DATA_DIR", tmp_path),
+            patch("bits_whisperer.ui.slash_commands._agents_cache", None),
+        ):
+            assert _load_agents() == {}
+
+    def test_lists_json_by_lowercase_stem(self, tmp_path: Path) -> None:
+        agents = tmp_path / "agents"
+        agents.mkdir()
+        (agents / "Meeting Notes.json").write_text("{}", encoding="utf-8")
+        (agents / "readme.txt").write_text("", encoding="utf-8")
+        with (
+            patch("bits_whisperer.ui.slash_commands.DATA_DIR", tmp_path),
+            patch("bits_whisperer.ui.slash_commands._agents_cache", None),
+        ):
+            assert _load_agents() == {"meeting notes": agents / "Meeting Notes.json"}
+            first = _load_agents()
+            assert _load_agents() is first
+
+            (agents / "extra.json").write_text("{}", encoding="utf-8")
+            os.utime(agents, ns=(0, agents.stat().st_mtime_ns + 1_000_000_000))
+            assert set(_load_agents()) == {"meeting notes", "extra"}
+
+
+class TestFindTemplate:
+    """Test /run template resolution."""
+
+    def test_preset_then_saved_file(self, tmp_path: Path) -> None:
+        agents = tmp_path / "agents"
+        agents.mkdir()
+        (agents / "Standup.json").write_text("{}", encoding="utf-8")
+        presets = {"meeting minutes": ("Meeting Minutes", "Write minutes.")}
+        with (
+            patch("bits_whisperer.ui.slash_commands.DATA_DIR", tmp_path),
+            patch("bits_whisperer.ui.slash_commands._agents_cache", None),
+            patch("bits_whisperer.ui.slash_commands._preset_index_cache", presets),
+        ):
+            assert _find_template("MEETING minutes") == (
+                "preset",
+                ("Meeting Minutes", "Write minutes."),
+            )
+            assert _find_template("standup") == ("file", agents / "Standup.json")
+            assert _find_template("nothing") is None
+
+
+class TestHistoryTokens:
+    """Test incremental token counting for /context."""
+
+    @staticmethod
+    def _panel(history: list[dict[str, str]]) -> SimpleNamespace:
+        return SimpleNamespace(_conversation_history=history, _history_token_cache=(("", ""), []))
+
+    def test_counts_only_new_messages(self) -> None:
+        panel = self._panel([{"role": "user", "content": "hello there"}])
+        with patch("bits_whisperer.ui.slash_commands.count_tokens", return_value=3) as counter:
+            assert _history_tokens(panel, "m", "p") == 3
+            panel._conversation_history.append({"role": "assistant", "content": "hi"})
+            assert _history_tokens(panel, "m", "p") == 6
+        assert counter.call_count == 2
+
+    def test_recounts_after_clear(self) -> None:
+        panel = self._panel([{"role": "user", "content": "a"}])
+        with patch("bits_whisperer.ui.slash_commands.count_tokens", return_value=1) as counter:
+            _history_tokens(panel, "m", "p")
+            panel._conversation_history.clear()
+            panel._conversation_history.append({"role": "user", "content": "b"})
+            assert _history_tokens(panel, "m", "p") == 1
+            _history_tokens(panel, "other", "p")
+        assert counter.call_count == 3
+
+
+class TestAIServices:
+    """Test per-panel reuse of the AI service and context manager."""
+
+    @staticmethod
+    def _panel() -> SimpleNamespace:
+        return SimpleNamespace(
+            _main_frame=SimpleNamespace(key_store=MagicMock()), _slash_services=None
+        )
+
+    def test_reused_while_settings_unchanged(self) -> None:
+        panel = self._panel()
+        settings = MagicMock()
+        with patch("bits_whisperer.ui.slash_commands.AppSettings.cached", return_value=settings):
+            first = _ai_services(panel)
+            second = _ai_services(panel)
+        assert first[0] is settings
+        assert second[1] is first[1]
+        assert second[2] is first[2]
+
+    def test_rebuilt_when_settings_reloaded(self) -> None:
+        panel = self._panel()
+        with patch(
+            "bits_whisperer.ui.slash_commands.AppSettings.cached",
+            side_effect=[MagicMock(), MagicMock()],
+        ):
+            first = _ai_services(panel)
+            second = _ai_services(panel)
+        assert second[1] is not first[1]
+        assert second[2] is not first[2]
+
+
+class TestAutocompletePopup:
+    """Test the slash command suggestion popup refresh."""
+
+    def test_same_suggestions_still_reset_selection_and_size(self) -> None:
+        from bits_whisperer.ui.copilot_chat_panel import _SlashAutocompletePopup
+
+        cmds = [
+            SlashCommand(
+                name="start", description="Start", category="App", handler=lambda p, a: None
+            )
+        ]
+        listbox = MagicMock()
+        listbox.GetCount.return_value = 1
+        listbox.GetCharHeight.return_value = 10
+        popup = SimpleNamespace(
+            _commands=[],
+            _labels={},
+            _listbox=listbox,
+            _anchor=MagicMock(),
+            _MAX_VISIBLE=8,
+            SetSize=MagicMock(),
+        )
+        popup._anchor.GetSize.return_value.GetWidth.return_value = 400
+
+        _SlashAutocompletePopup.update_commands(popup, cmds)
+        listbox.SetSelection(3)  # user moved down, then dismissed the popup
+        popup._anchor.GetSize.return_value.GetWidth.return_value = 500
+        _SlashAutocompletePopup.update_commands(popup, list(cmds))
+
+        listbox.Set.assert_called_once_with(["/start — Start"])
+        listbox.SetSelection.assert_called_with(0)
+        popup.SetSize.assert_called_with(500, 18)